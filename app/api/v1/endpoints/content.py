@@ -38,6 +38,7 @@ router = APIRouter(prefix="/content", tags=["Content Management"])
 )
 async def upload_material(
     file: UploadFile = File(...),
+    auto_process: bool = Query(False, description="Start AI processing right after upload"),
     current_user: UserResponse = Depends(require_admin)
 ) -> MaterialUploadResponse:
     """
@@ -71,13 +72,27 @@ async def upload_material(
     - Mind maps
     - Summaries
     
+    **Query Parameters:**
+    - `auto_process`: Start processing immediately in the background, from
+      the uploaded bytes (no re-download from storage)
+    
     **Requires:** Admin role
     """
-    return await ContentService.upload_material(
+    result = await ContentService.upload_material(
         file=file.file,
         filename=file.filename,
         uploaded_by=current_user.id
     )
+    
+    if auto_process:
+        from app.services.ai_processor import trigger_processing
+        import asyncio
+        
+        # Hand the bytes to the background task before the upload is closed
+        file.file.seek(0)
+        asyncio.create_task(trigger_processing(result["id"], file.file.read()))
+    
+    return result
 
 
 @router.get(
@@ -247,13 +262,18 @@ async def reprocess_material(
     description="Get all chapters for a subject"
 )
 async def get_chapters(
-    class_id: str = Query(..., description="Class ID"),
-    subject_id: str = Query(..., description="Subject ID"),
+    class_id: str = Query(..., description="Class label as detected from the textbook (e.g. \"11\"), not an ID"),
+    subject_id: str = Query(..., description="Subject label as detected from the textbook (e.g. \"Economics\"), not an ID"),
     current_user: UserResponse = Depends(get_current_user)
 ) -> ChapterListResponse:
     """
     Get all chapters for a subject.
     
+    **Query Parameters:**
+    - `class_id`: Class label, matched exactly against the class detected
+      for each uploaded material
+    - `subject_id`: Subject label, matched exactly against the detected subject
+    
     **Returns:**
     - Chapters extracted from textbooks
     - Exact chapter names as in book
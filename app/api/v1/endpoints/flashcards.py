@@ -10,6 +10,7 @@ import uuid
 
 from app.api.v1.dependencies import get_current_user
 from app.db.supabase import supabase
+from app.db.redis import UserCache
 from app.models.auth import UserResponse as User
 
 router = APIRouter(prefix="/flashcards", tags=["Flashcards"])
@@ -199,6 +200,7 @@ async def end_flashcard_session(
         supabase.table("study_sessions").update({
             "ended_at": datetime.utcnow().isoformat()
         }).eq("id", session_id).execute()
+        await UserCache.delete_stats(current_user.id)
         
         accuracy = (cards_known / cards_reviewed * 100) if cards_reviewed > 0 else 0
         
@@ -12,6 +12,7 @@ import random
 
 from app.api.v1.dependencies import get_current_user
 from app.db.supabase import supabase
+from app.db.redis import UserCache
 from app.models.auth import UserResponse as User
 from app.models.quiz import (
     QuizStartRequest,
@@ -273,6 +274,8 @@ async def submit_answer(
             "attempted_at": datetime.utcnow().isoformat()
         }).eq("id", existing.data[0]["id"]).execute()
     
+    await UserCache.delete_stats(current_user.id)
+    
     # Return immediate feedback if requested
     response = {
         "is_correct": is_correct,
@@ -340,6 +343,7 @@ async def submit_quiz(
         "time_spent_minutes": time_spent_minutes,
         "coins_earned": coins_earned
     }).eq("id", session_id).execute()
+    await UserCache.delete_stats(current_user.id)
     
     # Update user coins
     background_tasks.add_task(_award_coins, current_user.id, coins_earned)
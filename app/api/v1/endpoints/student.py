@@ -11,6 +11,7 @@ import logging
 
 from app.api.v1.dependencies import get_current_user
 from app.db.supabase import supabase
+from app.db.redis import UserCache
 from app.models.auth import UserResponse as User
 from app.models.content import (
     ChapterResponse,
@@ -303,6 +304,7 @@ async def end_study_session(
         }
         
         supabase.table("study_sessions").update(update_data).eq("id", session_id).execute()
+        await UserCache.delete_stats(current_user.id)
         
         return {
             "message": "Study session ended successfully",
@@ -397,6 +399,7 @@ async def track_question_attempt(
         }
         
         supabase.table("user_question_attempts").insert(attempt_data).execute()
+        await UserCache.delete_stats(current_user.id)
         
         return {
             "message": "Attempt tracked successfully", 
@@ -715,6 +718,7 @@ async def submit_quiz(
         supabase.table("study_sessions").update({
             "ended_at": datetime.utcnow().isoformat()
         }).eq("id", session_id).execute()
+        await UserCache.delete_stats(current_user.id)
         
         # Calculate results
         total_questions = len(answer_list)
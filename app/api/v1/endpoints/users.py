@@ -3,8 +3,13 @@ User profile API endpoints.
 Handles user profile viewing, updating, and statistics.
 """
 
-from fastapi import APIRouter, Depends, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+import base64
+import binascii
 
 from app.models.user import (
     UserProfileUpdate,
@@ -24,7 +29,12 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Create router
-router = APIRouter(prefix="/users", tags=["Users"])
+# orjson encodes the profile/list models several times faster than json.dumps
+router = APIRouter(
+    prefix="/users",
+    tags=["Users"],
+    default_response_class=ORJSONResponse
+)
 
 
 # ============================================================================
@@ -201,6 +211,27 @@ async def get_stats(
 # ADMIN USER MANAGEMENT
 # ============================================================================
 
+def _encode_cursor(created_at: datetime, user_id: str) -> str:
+    """Opaque, URL-safe keyset cursor for the admin user list."""
+    raw = f"{created_at.isoformat()}|{user_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor from _encode_cursor.
+    
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, user_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), str(UUID(user_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
 @router.get(
     "/admin/list",
     response_model=UserListResponse,
@@ -211,6 +242,7 @@ async def list_users(
     role: str = None,
     page: int = 1,
     page_size: int = 50,
+    cursor: Optional[str] = None,
     current_user: UserResponse = Depends(require_admin)
 ) -> UserListResponse:
     """
@@ -220,32 +252,48 @@ async def list_users(
     - `role`: Filter by role (student, parent, admin)
     - `page`: Page number (default: 1)
     - `page_size`: Items per page (default: 50, max: 100)
+    - `cursor`: `next_cursor` from the previous response (preferred over `page`
+      for deep pages; total is omitted when a cursor is given)
     
     **Returns:**
     - List of users
     - Total count
     - Pagination info
+    - Cursor for the next page
     
     **Requires:** Admin role
     """
     # Validate page size
     page_size = min(page_size, 100)
-    offset = (page - 1) * page_size
     
-    users, total = await AdminUserService.get_all_users(
+    after_created_at = after_id = None
+    if cursor:
+        after_created_at, after_id = _decode_cursor(cursor)
+        offset = 0
+    else:
+        offset = (page - 1) * page_size
+    
+    users, total, next_cursor = await AdminUserService.get_all_users(
         role=role,
         limit=page_size,
-        offset=offset
+        offset=offset,
+        after_created_at=after_created_at,
+        after_id=after_id,
+        # Exact total on the first page; deeper pages make do with the estimate
+        exact_count=page == 1
     )
     
-    total_pages = (total + page_size - 1) // page_size
+    total_pages = None
+    if total is not None:
+        total_pages = (total + page_size - 1) // page_size
     
     return UserListResponse(
         users=users,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=_encode_cursor(*next_cursor) if next_cursor else None
     )
 
 
@@ -88,6 +88,13 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = Field(default=10)
     DB_POOL_TIMEOUT: int = Field(default=30)
     DB_POOL_RECYCLE: int = Field(default=3600)
+    DB_MAX_CONCURRENCY: int = Field(default=10, description="Max concurrent bulk content writes")
+    DB_ASYNC_POOL_MIN_SIZE: int = Field(default=10, description="asyncpg pool min connections")
+    DB_ASYNC_POOL_MAX_SIZE: int = Field(default=25, description="asyncpg pool max connections")
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=0,
+        description="asyncpg prepared statement cache per connection (0 for transaction-mode poolers; enable on session mode, port 5432)"
+    )
 
     @field_validator("DATABASE_URL")
     @classmethod
@@ -120,6 +127,7 @@ class Settings(BaseSettings):
     OPENAI_MODEL: str = Field(default="gpt-4o-mini")
     OPENAI_MAX_TOKENS: int = Field(default=4096)
     OPENAI_TEMPERATURE: float = Field(default=0.3)
+    OPENAI_MAX_CONCURRENCY: int = Field(default=5, description="Max in-flight GPT generation requests")
 
     # ============================================================================
     # ANTHROPIC CLAUDE
@@ -128,6 +136,8 @@ class Settings(BaseSettings):
     ANTHROPIC_MODEL: str = Field(default="claude-3-5-sonnet-20241022")
     ANTHROPIC_MAX_TOKENS: int = Field(default=8192)
     ANTHROPIC_TEMPERATURE: float = Field(default=0.7)
+    ANTHROPIC_MAX_CONCURRENCY: int = Field(default=10, description="Max in-flight Claude requests per process")
+    CLAUDE_SEARCH_MODEL: str = Field(default="claude-haiku-4-5", description="Model for web-search question extraction")
 
     # ============================================================================
     # GOOGLE GEMINI AI
@@ -0,0 +1,103 @@
+"""
+Async PostgreSQL connection pool (asyncpg).
+Used for hot read paths; the Supabase client stays in use for auth,
+storage and writes.
+"""
+
+from typing import Optional
+import asyncio
+import logging
+
+import asyncpg
+
+from app.core.config import settings
+from app.core.errors import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# ASYNCPG POOL
+# ============================================================================
+
+def _asyncpg_dsn(url: str) -> str:
+    """asyncpg only understands plain postgresql:// URLs."""
+    return url.replace("postgresql+psycopg2://", "postgresql://", 1)
+
+
+class PostgresPool:
+    """
+    Async Postgres connection pool.
+    Singleton pattern for application-wide use.
+    """
+    _pool: Optional[asyncpg.Pool] = None
+    _lock = asyncio.Lock()
+    
+    @classmethod
+    async def get_pool(cls) -> asyncpg.Pool:
+        """
+        Get or create the connection pool.
+        
+        Returns:
+            asyncpg connection pool
+        
+        Raises:
+            DatabaseError: If the pool cannot be created
+        """
+        if cls._pool is None:
+            async with cls._lock:
+                if cls._pool is None:
+                    try:
+                        cls._pool = await asyncpg.create_pool(
+                            dsn=_asyncpg_dsn(settings.DATABASE_URL),
+                            min_size=settings.DB_ASYNC_POOL_MIN_SIZE,
+                            max_size=settings.DB_ASYNC_POOL_MAX_SIZE,
+                            max_inactive_connection_lifetime=300,
+                            # Prepared statements don't survive Supavisor/pgbouncer
+                            # transaction mode, so the cache is opt-in for
+                            # session-mode connections
+                            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+                        )
+                        
+                        logger.info(
+                            f"Postgres pool initialized "
+                            f"(min_size={settings.DB_ASYNC_POOL_MIN_SIZE}, "
+                            f"max_size={settings.DB_ASYNC_POOL_MAX_SIZE}, "
+                            f"statement_cache_size={settings.DB_STATEMENT_CACHE_SIZE})"
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to create Postgres pool: {str(e)}")
+                        raise DatabaseError(
+                            message="Failed to connect to database",
+                            details={"error": str(e)}
+                        )
+        
+        return cls._pool
+    
+    @classmethod
+    async def close(cls):
+        """Close all pooled connections."""
+        if cls._pool:
+            await cls._pool.close()
+            logger.info("Postgres pool closed")
+            cls._pool = None
+
+
+async def get_pool() -> asyncpg.Pool:
+    """
+    Get the shared asyncpg pool.
+    
+    Example:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow("SELECT 1")
+    """
+    return await PostgresPool.get_pool()
+
+
+async def close_pool():
+    """
+    Close the asyncpg pool.
+    Called during application shutdown.
+    """
+    await PostgresPool.close()
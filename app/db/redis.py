@@ -7,7 +7,7 @@ from typing import Optional, Any, Union
 import redis.asyncio as aioredis
 from redis.asyncio import Redis, ConnectionPool
 from redis.exceptions import RedisError
-import json
+import orjson
 import pickle
 import logging
 
@@ -139,8 +139,8 @@ class Cache:
             if deserialize:
                 try:
                     # Try JSON first
-                    return json.loads(value)
-                except (json.JSONDecodeError, TypeError):
+                    return orjson.loads(value)
+                except (orjson.JSONDecodeError, TypeError):
                     # Fall back to pickle
                     return pickle.loads(value)
             
@@ -179,8 +179,9 @@ class Cache:
             
             if serialize:
                 try:
-                    # Try JSON first (faster, more readable)
-                    serialized_value = json.dumps(value)
+                    # Try JSON first (faster, more readable; orjson also
+                    # covers datetime/UUID natively)
+                    serialized_value = orjson.dumps(value)
                 except (TypeError, ValueError):
                     # Fall back to pickle for complex objects
                     serialized_value = pickle.dumps(value)
@@ -357,6 +358,41 @@ class UserCache:
     async def delete_user(user_id: str) -> bool:
         """Delete cached user data."""
         return await Cache.delete(f"{UserCache.PREFIX}:{user_id}")
+    
+    PROFILE_TTL = 300
+    
+    @staticmethod
+    async def get_profile(user_id: str) -> Optional[dict]:
+        """Get cached user profile."""
+        return await Cache.get(f"{UserCache.PREFIX}:{user_id}:profile")
+    
+    @staticmethod
+    async def set_profile(user_id: str, profile_data: dict, ttl: int = PROFILE_TTL) -> bool:
+        """Cache user profile."""
+        return await Cache.set(f"{UserCache.PREFIX}:{user_id}:profile", profile_data, ttl=ttl)
+    
+    @staticmethod
+    async def delete_profile(user_id: str) -> bool:
+        """Invalidate cached user profile (call after any profile mutation)."""
+        return await Cache.delete(f"{UserCache.PREFIX}:{user_id}:profile")
+    
+    STATS_TTL = 120
+    EMPTY_STATS_TTL = 30
+    
+    @staticmethod
+    async def get_stats(user_id: str) -> Optional[dict]:
+        """Get cached user statistics."""
+        return await Cache.get(f"{UserCache.PREFIX}:{user_id}:stats")
+    
+    @staticmethod
+    async def set_stats(user_id: str, stats_data: dict, ttl: int = STATS_TTL) -> bool:
+        """Cache user statistics."""
+        return await Cache.set(f"{UserCache.PREFIX}:{user_id}:stats", stats_data, ttl=ttl)
+    
+    @staticmethod
+    async def delete_stats(user_id: str) -> bool:
+        """Invalidate cached user statistics (call when sessions/attempts change)."""
+        return await Cache.delete(f"{UserCache.PREFIX}:{user_id}:stats")
 
 
 class SessionCache:
@@ -396,6 +432,28 @@ class ContentCache:
         return await Cache.set(f"{ContentCache.PREFIX}:{content_id}", content_data, ttl=ttl)
 
 
+class AdminCache:
+    """Cache operations for admin dashboards."""
+    
+    PREFIX = "admin"
+    USER_COUNT_TTL = 60
+    
+    @staticmethod
+    async def get_user_count(role: Optional[str] = None) -> Optional[int]:
+        """Get cached user count for a role filter."""
+        return await Cache.get(f"{AdminCache.PREFIX}:users:count:{role or 'all'}")
+    
+    @staticmethod
+    async def set_user_count(role: Optional[str], count: int, ttl: int = USER_COUNT_TTL) -> bool:
+        """Cache user count for a role filter."""
+        return await Cache.set(f"{AdminCache.PREFIX}:users:count:{role or 'all'}", count, ttl=ttl)
+    
+    @staticmethod
+    async def clear_user_counts() -> int:
+        """Invalidate cached user counts for every role filter."""
+        return await Cache.clear_pattern(f"{AdminCache.PREFIX}:users:count:*")
+
+
 # ============================================================================
 # RATE LIMITING
 # ============================================================================
@@ -3,8 +3,9 @@ Supabase client configuration and initialization.
 Provides both Supabase client and direct PostgreSQL connection.
 """
 
-from typing import Optional
-from supabase import create_client, Client
+from typing import Optional, Callable, TypeVar
+import asyncio
+from supabase import create_client, Client, acreate_client, AsyncClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 from sqlalchemy.pool import QueuePool
@@ -15,6 +16,8 @@ from app.core.errors import DatabaseError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # ============================================================================
 # SUPABASE CLIENT
@@ -25,6 +28,8 @@ class SupabaseClient:
     Singleton Supabase client for auth and storage operations.
     """
     _instance: Optional[Client] = None
+    _async_instance: Optional[AsyncClient] = None
+    _async_lock = asyncio.Lock()
     
     @classmethod
     def get_client(cls) -> Client:
@@ -50,6 +55,35 @@ class SupabaseClient:
         
         return cls._instance
     
+    @classmethod
+    async def get_async_client(cls) -> AsyncClient:
+        """
+        Get or create async Supabase client instance.
+        
+        Queries on this client are awaited directly, without a worker
+        thread per ``.execute()``.
+        
+        Returns:
+            Async Supabase client instance
+        """
+        if cls._async_instance is None:
+            async with cls._async_lock:
+                if cls._async_instance is None:
+                    try:
+                        cls._async_instance = await acreate_client(
+                            supabase_url=settings.SUPABASE_URL,
+                            supabase_key=settings.SUPABASE_SERVICE_ROLE_KEY
+                        )
+                        logger.info("Async Supabase client initialized successfully")
+                    except Exception as e:
+                        logger.error(f"Failed to initialize async Supabase client: {str(e)}")
+                        raise DatabaseError(
+                            message="Failed to connect to Supabase",
+                            details={"error": str(e)}
+                        )
+        
+        return cls._async_instance
+    
     @classmethod
     def get_auth_client(cls) -> Client:
         """
@@ -76,6 +110,37 @@ class SupabaseClient:
 supabase: Client = SupabaseClient.get_client()
 
 
+async def get_supabase_async() -> AsyncClient:
+    """
+    Get the async Supabase client (created on first use, since creating
+    it needs a running event loop).
+    
+    Example:
+        db = await get_supabase_async()
+        await db.table("users").insert(row).execute()
+    """
+    return await SupabaseClient.get_async_client()
+
+
+# ============================================================================
+# ASYNC HELPERS
+# ============================================================================
+
+async def run_in_thread(fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking Supabase call in a worker thread.
+    
+    supabase-py is synchronous, so calling ``.execute()`` directly inside an
+    async handler blocks the event loop for the whole HTTP round trip.
+    
+    Example:
+        result = await run_in_thread(
+            lambda: supabase.table("users").select("*").execute()
+        )
+    """
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+
 # ============================================================================
 # SQLALCHEMY DATABASE ENGINE
 # ============================================================================
@@ -87,6 +87,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error closing database: {str(e)}")
 
+    # Close asyncpg pool
+    try:
+        from app.db.pool import close_pool
+        await close_pool()
+    except Exception as e:
+        logger.error(f"Error closing Postgres pool: {str(e)}")
+
+    # Stop PDF extraction workers
+    try:
+        from app.services.content_service import shutdown_extract_pool
+        shutdown_extract_pool()
+    except Exception as e:
+        logger.error(f"Error stopping PDF workers: {str(e)}")
+
     # Close Redis connections
     try:
         from app.db.redis import close_redis
@@ -3,7 +3,7 @@ Pydantic models for user data.
 """
 
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_serializer
 from datetime import datetime, date
 
 
@@ -27,6 +27,11 @@ class UserProfileUpdate(BaseModel):
     # Preferences
     preferred_language: Optional[str] = Field(None, max_length=10)
     timezone: Optional[str] = Field(None, max_length=50)
+    
+    @field_serializer("date_of_birth")
+    def serialize_date_of_birth(self, value: Optional[date]) -> Optional[str]:
+        """Store dates as ISO strings in update payloads."""
+        return str(value) if value is not None else None
 
 
 class UserProfileResponse(BaseModel):
@@ -90,6 +95,8 @@ class UserStatsResponse(BaseModel):
     achievements_earned: int
     
     model_config = {
+        # Immutable so the shared empty-stats default can be returned as is
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "total_study_time_minutes": 1250,
@@ -121,6 +128,13 @@ class UserListItem(BaseModel):
     created_at: datetime
     last_login_at: Optional[datetime] = None
     
+    # Embedded from user_profiles / user_stats (students)
+    school_name: Optional[str] = None
+    board: Optional[str] = None
+    subjects: Optional[list[str]] = None
+    total_questions_attempted: Optional[int] = None
+    accuracy_percentage: Optional[float] = None
+    
     model_config = {"from_attributes": True}
 
 
@@ -128,10 +142,11 @@ class UserListResponse(BaseModel):
     """Paginated user list response."""
     
     users: list[UserListItem]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # ============================================================================
@@ -148,6 +163,11 @@ class AcademicInfoUpdate(BaseModel):
     preferred_study_time: Optional[str] = None
     target_score: Optional[int] = Field(None, ge=0, le=100)
     exam_date: Optional[date] = None
+    
+    @field_serializer("exam_date")
+    def serialize_exam_date(self, value: Optional[date]) -> Optional[str]:
+        """Store dates as ISO strings in update payloads."""
+        return str(value) if value is not None else None
 
 
 class PreferencesUpdate(BaseModel):
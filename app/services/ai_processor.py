@@ -22,8 +22,13 @@ class AIProcessor:
     """Production-grade AI content processor with Smart Hybrid mode."""
 
     @staticmethod
-    async def process_material(material_id: str):
-        """Main processing pipeline."""
+    async def process_material(material_id: str, pdf_bytes: Optional[bytes] = None):
+        """
+        Main processing pipeline.
+        
+        If pdf_bytes is given (still in memory from the upload), text is
+        extracted from it instead of downloading the PDF from storage.
+        """
         try:
             logger.info(f"Starting GPT-4o-mini processing for {material_id}")
             
@@ -35,9 +40,12 @@ class AIProcessor:
             if not material:
                 raise Exception("Material not found")
             
-            # Step 3: Download and extract PDF
-            logger.info(f"Downloading PDF from {material['file_url']}")
-            pdf_text = await AIProcessor._download_pdf(material['file_url'])
+            # Step 3: Extract PDF text (downloading it unless handed the upload bytes)
+            if pdf_bytes is None:
+                logger.info(f"Downloading PDF from {material['file_url']}")
+                pdf_text = await AIProcessor._download_pdf(material['file_url'])
+            else:
+                pdf_text = await ContentService.extract_text(pdf_bytes)
             logger.info(f"Extracted {len(pdf_text)} characters")
             
             # Step 4: Extract structure with GPT
@@ -240,7 +248,7 @@ class AIProcessor:
             async with httpx.AsyncClient(timeout=60.0) as client:
                 response = await client.get(url)
                 response.raise_for_status()
-                return ContentService.extract_text_from_pdf(response.content)
+                return await ContentService.extract_text(response.content)
         except Exception as e:
             logger.error(f"Failed to download PDF: {str(e)}")
             raise
@@ -264,6 +272,6 @@ class AIProcessor:
 # ENTRY POINT
 # ================================================================
 
-async def trigger_processing(material_id: str):
+async def trigger_processing(material_id: str, pdf_bytes: Optional[bytes] = None):
     """Trigger Smart Hybrid processing."""
-    await AIProcessor.process_material(material_id)
\ No newline at end of file
+    await AIProcessor.process_material(material_id, pdf_bytes)
\ No newline at end of file
@@ -8,7 +8,6 @@ import re
 import asyncio
 import logging
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor
 
 from openai import AsyncOpenAI
 import anthropic
@@ -17,11 +16,14 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 openai = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-claude = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+claude = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
 
 MAX_CHARS = 15000
 MAX_PARALLEL = 6
-EXECUTOR = ThreadPoolExecutor(max_workers=MAX_PARALLEL)
+
+# Shared cap on concurrent Claude calls (content generation and web search),
+# so batch processing is throttled instead of tripping rate limits
+ANTHROPIC_SEM = asyncio.Semaphore(settings.ANTHROPIC_MAX_CONCURRENCY)
 
 
 def sanitize(text: str) -> str:
@@ -288,25 +290,15 @@ class ContentAI:
 
     @staticmethod
     async def _run_claude(prompt: str, max_tokens: int):
-        """Run Claude in thread pool."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            EXECUTOR,
-            ContentAI._claude_sync,
-            prompt,
-            max_tokens
-        )
-
-    @staticmethod
-    def _claude_sync(prompt: str, max_tokens: int):
-        """Synchronous Claude call with robust JSON extraction."""
+        """Claude call with robust JSON extraction."""
         try:
-            message = claude.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=max_tokens,
-                temperature=0.2,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            async with ANTHROPIC_SEM:
+                message = await claude.messages.create(
+                    model="claude-sonnet-4-20250514",
+                    max_tokens=max_tokens,
+                    temperature=0.2,
+                    messages=[{"role": "user", "content": prompt}]
+                )
             
             text = message.content[0].text.strip()
             
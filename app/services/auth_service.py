@@ -24,6 +24,7 @@ from app.core.errors import (
     ValidationError,
 )
 from app.db.supabase import supabase
+from app.db.redis import UserCache
 from app.models.auth import (
     UserRegisterRequest,
     UserLoginRequest,
@@ -142,6 +143,7 @@ class AuthService:
             supabase.table("users").update({
                 "last_login_at": datetime.utcnow().isoformat()
             }).eq("id", user_id).execute()
+            await UserCache.delete_profile(user_id)
             
             # Convert to response models
             user_response = UserResponse(**created_user)
@@ -213,6 +215,7 @@ class AuthService:
             supabase.table("users").update({
                 "last_login_at": datetime.utcnow().isoformat()
             }).eq("id", user_id).execute()
+            await UserCache.delete_profile(user_id)
             
             # Convert to response models
             user_response = UserResponse(**user)
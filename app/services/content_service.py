@@ -3,17 +3,171 @@ Content Service - Handle material uploads and chapter management
 """
 
 from typing import Optional, List, Dict, Any, Tuple
+import asyncio
 import uuid
 from datetime import datetime
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
 import io
+import os
 import logging
+import multiprocessing
+import tempfile
+import threading
+import weakref
 
-from app.db.supabase import supabase
+from app.core.config import settings
+from app.db.supabase import supabase, run_in_thread
 from app.core.errors import AIServiceError
-import PyPDF2
+from app.services.pdf_worker import iter_page_text, extract_page_range
+import pypdfium2 as pdfium
+from cachetools import TTLCache
+from tusclient.client import TusClient
 
 logger = logging.getLogger(__name__)
 
+PDF_HEADER = b"%PDF-"
+PDF_EOF_MARKER = b"%%EOF"
+
+# Supabase storage accepts single-request uploads up to ~6MB; anything larger
+# goes through the TUS resumable endpoint, which requires exactly 6MB chunks
+RESUMABLE_UPLOAD_THRESHOLD = 6 * 1024 * 1024
+RESUMABLE_CHUNK_SIZE = 6 * 1024 * 1024
+RESUMABLE_RETRIES = 3
+
+# Progress percentage and display label per processing status
+PROGRESS_MAP = MappingProxyType({
+    "pending": 0,
+    "extracting": 25,
+    "generating": 50,
+    "validating": 75,
+    "completed": 100,
+    "failed": 0
+})
+STEP_LABELS = MappingProxyType({
+    status: status.replace("_", " ").title() for status in PROGRESS_MAP
+})
+
+# Chapter/topic metadata is effectively read-only once a material is processed
+CHAPTER_CACHE_TTL = 300
+_chapters_cache: TTLCache = TTLCache(maxsize=256, ttl=CHAPTER_CACHE_TTL)
+_topics_cache: TTLCache = TTLCache(maxsize=1024, ttl=CHAPTER_CACHE_TTL)
+_chapter_cache: TTLCache = TTLCache(maxsize=1024, ttl=CHAPTER_CACHE_TTL)
+# One lock per cache key, so concurrent misses for the same data hit
+# Supabase once without blocking misses for other keys; a lock disappears
+# as soon as nobody holds or waits on it
+_fetch_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+# Below this page count, handing pages to worker processes costs more than it saves
+PARALLEL_EXTRACT_MIN_PAGES = 200
+PDF_EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+_extract_pool: Optional[ProcessPoolExecutor] = None
+_extract_pool_lock = threading.Lock()
+
+# PDFium is not thread-safe; in-process use is serialised across threads
+_pdfium_lock = threading.Lock()
+
+
+def _key_lock(key: Tuple) -> asyncio.Lock:
+    """Lock guarding the fetch for one cache key."""
+    lock = _fetch_locks.get(key)
+    if lock is None:
+        lock = _fetch_locks[key] = asyncio.Lock()
+    return lock
+
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    """
+    Shared worker pool for large PDFs, created on first use.
+    Workers are spawned rather than forked: forking this threaded,
+    event-loop process can deadlock the child.
+    """
+    global _extract_pool
+    with _extract_pool_lock:
+        if _extract_pool is None:
+            _extract_pool = ProcessPoolExecutor(
+                max_workers=PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _extract_pool
+
+
+def shutdown_extract_pool() -> None:
+    """
+    Stop the PDF worker processes.
+    Called during application shutdown.
+    """
+    global _extract_pool
+    with _extract_pool_lock:
+        if _extract_pool is not None:
+            _extract_pool.shutdown(cancel_futures=True)
+            _extract_pool = None
+
+
+def _extract_in_workers(pdf_bytes: bytes, page_count: int) -> List[str]:
+    """
+    Extract all pages using the shared pool, one contiguous page range per
+    worker. The PDF is written to a temp file once so each task only
+    carries a path, not the document bytes.
+    """
+    step = -(-page_count // PDF_EXTRACT_WORKERS)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        tmp.write(pdf_bytes)
+    
+    try:
+        pool = _get_extract_pool()
+        futures = [
+            pool.submit(extract_page_range, tmp.name, start, stop)
+            for start, stop in ranges
+        ]
+        return [t for future in futures for t in future.result()]
+    finally:
+        os.unlink(tmp.name)
+
+
+def _public_url(bucket: str, storage_path: str) -> str:
+    """Public object URL; deterministic from bucket + path, so no client call needed."""
+    base_url = settings.SUPABASE_URL.rstrip("/")
+    return f"{base_url}/storage/v1/object/public/{bucket}/{quote(storage_path)}"
+
+
+def _upload_to_storage(bucket: str, storage_path: str, file_bytes: bytes, content_type: str) -> None:
+    """
+    Upload bytes to Supabase storage (blocking).
+    Large files use the resumable (TUS) endpoint so a dropped connection only
+    retries the failed chunk, not the whole file.
+    """
+    if len(file_bytes) <= RESUMABLE_UPLOAD_THRESHOLD:
+        supabase.storage.from_(bucket).upload(
+            storage_path,
+            file_bytes,
+            {"content-type": content_type}
+        )
+        return
+    
+    client = TusClient(
+        f"{settings.SUPABASE_URL}/storage/v1/upload/resumable",
+        headers={
+            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_ROLE_KEY}",
+            "x-upsert": "false",
+        },
+    )
+    uploader = client.uploader(
+        file_stream=io.BytesIO(file_bytes),
+        chunk_size=RESUMABLE_CHUNK_SIZE,
+        retries=RESUMABLE_RETRIES,
+        retry_delay=1,
+        metadata={
+            "bucketName": bucket,
+            "objectName": storage_path,
+            "contentType": content_type,
+        },
+    )
+    uploader.upload()
+
 
 class ContentService:
     """Handle material uploads and processing."""
@@ -24,7 +178,12 @@ class ContentService:
         filename: str,
         uploaded_by: str
     ) -> Dict[str, Any]:
-        """Upload PDF material to Supabase storage."""
+        """
+        Upload PDF material to Supabase storage.
+        
+        Text extraction is left to background processing, which can be handed
+        the same in-memory bytes (see trigger_processing).
+        """
         try:
             # Validate file size (max 50MB)
             file.seek(0)
@@ -37,10 +196,9 @@ class ContentService:
             if file_size < 1024:  # 1KB
                 raise AIServiceError("File too small. Minimum size is 1KB")
             
-            # Validate PDF format
-            try:
-                PyPDF2.PdfReader(io.BytesIO(file_bytes))
-            except Exception:
+            # Validate PDF format (header + trailer marker; full parse happens
+            # later in extract_text_from_pdf during background processing)
+            if not file_bytes.startswith(PDF_HEADER) or PDF_EOF_MARKER not in file_bytes[-1024:]:
                 raise AIServiceError("Invalid PDF file")
             
             # Generate unique filename
@@ -51,17 +209,18 @@ class ContentService:
             storage_path = f"uploads/{storage_filename}"
             
             try:
-                supabase.storage.from_("study-materials").upload(
+                await run_in_thread(
+                    _upload_to_storage,
+                    "study-materials",
                     storage_path,
                     file_bytes,
-                    {"content-type": "application/pdf"}
+                    "application/pdf"
                 )
             except Exception as e:
                 logger.error(f"Storage upload failed: {str(e)}")
                 raise AIServiceError("Failed to upload file to storage")
             
-            # Get public URL
-            file_url = supabase.storage.from_("study-materials").get_public_url(storage_path)
+            file_url = _public_url("study-materials", storage_path)
             
             # Create database record
             material_data = {
@@ -76,7 +235,9 @@ class ContentService:
                 "created_at": datetime.utcnow().isoformat()
             }
             
-            result = supabase.table("uploaded_materials").insert(material_data).execute()
+            result = await run_in_thread(
+                lambda: supabase.table("uploaded_materials").insert(material_data).execute()
+            )
             
             if not result.data:
                 raise AIServiceError("Failed to create database record")
@@ -106,20 +267,18 @@ class ContentService:
     ) -> Tuple[List[Dict], int]:
         """Get all uploaded materials with pagination."""
         try:
-            query = supabase.table("uploaded_materials").select("*")
+            # count="exact" returns the total in the Content-Range header,
+            # so the page and the total come back in one round trip
+            query = supabase.table("uploaded_materials").select("*", count="exact")
             
             if status:
                 query = query.eq("processing_status", status)
             
-            result = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+            result = await run_in_thread(
+                query.order("created_at", desc=True).range(offset, offset + limit - 1).execute
+            )
             
-            # Get total count
-            count_query = supabase.table("uploaded_materials").select("id", count="exact")
-            if status:
-                count_query = count_query.eq("processing_status", status)
-            count_result = count_query.execute()
-            
-            total = len(count_result.data) if count_result.data else 0
+            total = result.count or 0
             
             return result.data or [], total
             
@@ -131,7 +290,9 @@ class ContentService:
     async def get_processing_status(material_id: str) -> Dict[str, Any]:
         """Get processing status with calculated progress."""
         try:
-            result = supabase.table("uploaded_materials").select("*").eq("id", material_id).execute()
+            result = await run_in_thread(
+                lambda: supabase.table("uploaded_materials").select("*").eq("id", material_id).execute()
+            )
             
             if not result.data:
                 raise AIServiceError("Material not found")
@@ -139,22 +300,12 @@ class ContentService:
             material = result.data[0]
             status = material.get("processing_status", "pending")
             
-            # Calculate progress percentage
-            progress_map = {
-                "pending": 0,
-                "extracting": 25,
-                "generating": 50,
-                "validating": 75,
-                "completed": 100,
-                "failed": 0
-            }
-            
             return {
                 "material_id": material_id,
                 "filename": material.get("original_filename", ""),
                 "processing_status": status,
-                "progress_percentage": progress_map.get(status, 0),
-                "current_step": status.replace("_", " ").title(),
+                "progress_percentage": PROGRESS_MAP.get(status, 0),
+                "current_step": STEP_LABELS.get(status) or status.replace("_", " ").title(),
                 "chapters_extracted": material.get("chapters_extracted", 0),
                 "topics_extracted": material.get("topics_extracted", 0),
                 "mcqs_generated": material.get("mcqs_generated", 0),
@@ -175,17 +326,21 @@ class ContentService:
         """Start/restart processing for a material."""
         try:
             # Verify material exists
-            result = supabase.table("uploaded_materials").select("id").eq("id", material_id).execute()
+            result = await run_in_thread(
+                lambda: supabase.table("uploaded_materials").select("id").eq("id", material_id).execute()
+            )
             
             if not result.data:
                 return False
             
             # Update status to pending
-            supabase.table("uploaded_materials").update({
-                "processing_status": "pending",
-                "error_message": None,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", material_id).execute()
+            await run_in_thread(
+                lambda: supabase.table("uploaded_materials").update({
+                    "processing_status": "pending",
+                    "error_message": None,
+                    "updated_at": datetime.utcnow().isoformat()
+                }).eq("id", material_id).execute()
+            )
             
             logger.info(f"Processing queued for material: {material_id}")
             return True
@@ -194,37 +349,44 @@ class ContentService:
             logger.error(f"Failed to start processing: {str(e)}")
             return False
     
+    @staticmethod
+    async def extract_text(pdf_bytes: bytes) -> str:
+        """Extract text from PDF bytes without blocking the event loop."""
+        return await asyncio.to_thread(ContentService.extract_text_from_pdf, pdf_bytes)
+    
     @staticmethod
     def extract_text_from_pdf(pdf_bytes: bytes) -> str:
         """
         Extract text from PDF bytes.
-        Note: This is SYNCHRONOUS (not async) because PyPDF2 is synchronous.
+        Note: This is SYNCHRONOUS (not async) because PDFium is synchronous.
         """
         try:
             if not pdf_bytes or len(pdf_bytes) < 100:
                 raise AIServiceError("Invalid PDF data")
             
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
-            
-            if len(pdf_reader.pages) == 0:
-                raise AIServiceError("PDF has no pages")
-            
-            text = ""
-            for page_num, page in enumerate(pdf_reader.pages):
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(pdf_bytes)
                 try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n\n"
-                except Exception as e:
-                    logger.warning(f"Failed to extract page {page_num}: {str(e)}")
-                    continue
-            
-            text = text.strip()
+                    page_count = len(pdf)
+                    
+                    if page_count == 0:
+                        raise AIServiceError("PDF has no pages")
+                    
+                    parallel = page_count >= PARALLEL_EXTRACT_MIN_PAGES and PDF_EXTRACT_WORKERS >= 2
+                    if not parallel:
+                        page_texts = list(iter_page_text(pdf, 0, page_count))
+                finally:
+                    pdf.close()
+            
+            if parallel:
+                page_texts = _extract_in_workers(pdf_bytes, page_count)
+            
+            text = "\n\n".join(t for t in page_texts if t).strip()
             
             if not text or len(text) < 100:
                 raise AIServiceError("No text content found in PDF")
             
-            logger.info(f"✅ Extracted {len(text)} characters from {len(pdf_reader.pages)} pages")
+            logger.info(f"✅ Extracted {len(text)} characters from {page_count} pages")
             
             return text
             
@@ -236,15 +398,36 @@ class ContentService:
 
 
 class ChapterService:
-    """Handle chapters and topics queries."""
+    """Handle chapters and topics queries (cached in-process with a short TTL)."""
     
     @staticmethod
     async def get_chapters_by_subject(class_id: str, subject_id: str) -> List[Dict]:
         """Get chapters for a specific class and subject."""
+        key = (class_id, subject_id)
+        cached = _chapters_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            # For now, return all chapters (TODO: Add class/subject filtering)
-            result = supabase.table("chapters").select("*").order("chapter_number").execute()
-            return result.data or []
+            # Lock so concurrent misses for the same data hit Supabase once
+            async with _key_lock(("chapters", *key)):
+                cached = _chapters_cache.get(key)
+                if cached is not None:
+                    return cached
+                
+                # Chapters carry no class/subject columns; those are detected per
+                # uploaded material, so filter through an inner-joined empty embed
+                result = await run_in_thread(
+                    lambda: supabase.table("chapters")
+                    .select("*, uploaded_materials!inner()")
+                    .eq("uploaded_materials.detected_class", class_id)
+                    .eq("uploaded_materials.detected_subject", subject_id)
+                    .order("chapter_number")
+                    .execute()
+                )
+                chapters = result.data or []
+                _chapters_cache[key] = chapters
+                return chapters
             
         except Exception as e:
             logger.error(f"Failed to get chapters: {str(e)}")
@@ -253,12 +436,24 @@ class ChapterService:
     @staticmethod
     async def get_topics_by_chapter(chapter_id: str) -> List[Dict]:
         """Get all topics for a specific chapter."""
+        cached = _topics_cache.get(chapter_id)
+        if cached is not None:
+            return cached
+        
         try:
-            result = supabase.table("topics").select("*").eq(
-                "chapter_id", chapter_id
-            ).order("display_order").execute()
-            
-            return result.data or []
+            async with _key_lock(("topics", chapter_id)):
+                cached = _topics_cache.get(chapter_id)
+                if cached is not None:
+                    return cached
+                
+                result = await run_in_thread(
+                    lambda: supabase.table("topics").select("*").eq(
+                        "chapter_id", chapter_id
+                    ).order("display_order").execute()
+                )
+                topics = result.data or []
+                _topics_cache[chapter_id] = topics
+                return topics
             
         except Exception as e:
             logger.error(f"Failed to get topics: {str(e)}")
@@ -267,10 +462,25 @@ class ChapterService:
     @staticmethod
     async def get_chapter_by_id(chapter_id: str) -> Optional[Dict]:
         """Get single chapter by ID."""
+        cached = _chapter_cache.get(chapter_id)
+        if cached is not None:
+            return cached
+        
         try:
-            result = supabase.table("chapters").select("*").eq("id", chapter_id).execute()
-            return result.data[0] if result.data else None
+            async with _key_lock(("chapter", chapter_id)):
+                cached = _chapter_cache.get(chapter_id)
+                if cached is not None:
+                    return cached
+                
+                result = await run_in_thread(
+                    lambda: supabase.table("chapters").select("*").eq("id", chapter_id).execute()
+                )
+                if not result.data:
+                    return None
+                
+                _chapter_cache[chapter_id] = result.data[0]
+                return result.data[0]
             
         except Exception as e:
             logger.error(f"Failed to get chapter: {str(e)}")
-            return None
\ No newline at end of file
+            return None
@@ -6,17 +6,65 @@ $5 = 50+ full books processed!
 
 import asyncio
 import logging
-import json
+import orjson
 import uuid
 from typing import Dict, List, Any
+import httpx
+import openai
 from openai import AsyncOpenAI
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from app.core.config import settings
-from app.db.supabase import supabase
+from app.db.supabase import supabase, run_in_thread
 
 logger = logging.getLogger(__name__)
 
-openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+# One long-lived client so TLS connections stay warm across chapters;
+# HTTP/2 multiplexes the per-chapter calls over a single connection
+openai_client = AsyncOpenAI(
+    api_key=settings.OPENAI_API_KEY,
+    # _create_completion's tenacity policy is the only retry layer
+    max_retries=0,
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=16,
+            keepalive_expiry=120
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        http2=True
+    )
+)
+
+# Bound fan-out when many chapters are generated at once so we stay under
+# OpenAI rate limits and Supabase's connection limit
+_GPT_SEM = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+_DB_SEM = asyncio.Semaphore(settings.DB_MAX_CONCURRENCY)
+
+# Transient failures (429, 5xx, network) worth retrying; 4xx request errors are not
+RETRYABLE_OPENAI_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=2, min=2, max=16),
+    retry=retry_if_exception_type(RETRYABLE_OPENAI_ERRORS),
+    reraise=True,
+)
+async def _create_completion(**kwargs):
+    """chat.completions.create with exponential backoff on transient errors."""
+    async with _GPT_SEM:
+        return await openai_client.chat.completions.create(**kwargs)
 
 
 class GPTContentGenerator:
@@ -43,9 +91,8 @@ class GPTContentGenerator:
             cheatsheet = await GPTContentGenerator._generate_cheatsheet(chapter_name, topics_text)
             flashcards = await GPTContentGenerator._generate_flashcards(chapter_name, topics_text)
             
-            mcqs_easy = await GPTContentGenerator._generate_mcqs(chapter_name, board, class_, "easy")
-            mcqs_medium = await GPTContentGenerator._generate_mcqs(chapter_name, board, class_, "medium")
-            mcqs_hard = await GPTContentGenerator._generate_mcqs(chapter_name, board, class_, "hard")
+            mcqs = await GPTContentGenerator._generate_all_mcqs(chapter_name, board, class_)
+            mcqs_easy, mcqs_medium, mcqs_hard = mcqs["easy"], mcqs["medium"], mcqs["hard"]
             
             input_questions = await GPTContentGenerator._generate_input_questions(chapter_name, board, class_)
             
@@ -77,7 +124,7 @@ class GPTContentGenerator:
     async def _generate_concept(chapter_name: str, topics: str) -> Dict:
         """Generate concept explanation with GPT."""
         try:
-            response = await openai_client.chat.completions.create(
+            response = await _create_completion(
                 model="gpt-4o-mini",
                 temperature=0.7,
                 response_format={"type": "json_object"},
@@ -103,7 +150,7 @@ Return ONLY valid JSON:
                 ]
             )
             
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(response.choices[0].message.content)
         except Exception as e:
             logger.error(f"Concept generation failed: {str(e)[:100]}")
             return {}
@@ -112,7 +159,7 @@ Return ONLY valid JSON:
     async def _generate_cheatsheet(chapter_name: str, topics: str) -> Dict:
         """Generate quick reference cheatsheet."""
         try:
-            response = await openai_client.chat.completions.create(
+            response = await _create_completion(
                 model="gpt-4o-mini",
                 temperature=0.5,
                 response_format={"type": "json_object"},
@@ -145,7 +192,7 @@ Return ONLY valid JSON:
                 ]
             )
             
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(response.choices[0].message.content)
         except Exception as e:
             logger.error(f"Cheatsheet generation failed: {str(e)[:100]}")
             return {}
@@ -154,7 +201,7 @@ Return ONLY valid JSON:
     async def _generate_flashcards(chapter_name: str, topics: str) -> List:
         """Generate flashcards for active recall."""
         try:
-            response = await openai_client.chat.completions.create(
+            response = await _create_completion(
                 model="gpt-4o-mini",
                 temperature=0.6,
                 response_format={"type": "json_object"},
@@ -184,19 +231,24 @@ Return ONLY valid JSON:
                 ]
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             return result.get("flashcards", [])
         except Exception as e:
             logger.error(f"Flashcard generation failed: {str(e)[:100]}")
             return []
     
     @staticmethod
-    async def _generate_mcqs(chapter_name: str, board: str, class_: str, difficulty: str) -> List:
-        """Generate MCQs at specified difficulty."""
+    async def _generate_all_mcqs(chapter_name: str, board: str, class_: str) -> Dict[str, List]:
+        """Generate easy, medium and hard MCQs in a single request."""
+        empty = {"easy": [], "medium": [], "hard": []}
         try:
-            response = await openai_client.chat.completions.create(
+            response = await _create_completion(
                 model="gpt-4o-mini",
                 temperature=0.7,
+                max_tokens=12000,
+                # ~12k output tokens can take minutes; the client's 60s read
+                # timeout would otherwise abort and retry the whole call
+                timeout=httpx.Timeout(300.0, connect=5.0),
                 response_format={"type": "json_object"},
                 messages=[
                     {
@@ -205,22 +257,22 @@ Return ONLY valid JSON:
                     },
                     {
                         "role": "user",
-                        "content": f"""Generate 15 {difficulty} difficulty MCQs for:
+                        "content": f"""Generate 15 MCQs at EACH difficulty level (easy, medium, hard) for:
 
 Chapter: {chapter_name}
 Board: {board}
 Class: {class_}
-Difficulty: {difficulty}
 
 Requirements:
 - All 4 options must be plausible
 - Only ONE correct answer
 - Clear explanations
 - Board exam style
+- Exactly 15 questions under each of "easy", "medium" and "hard"
 
 Return ONLY valid JSON:
 {{
-  "mcqs": [
+  "easy": [
     {{
       "question_text": "Question text",
       "options": [
@@ -231,26 +283,37 @@ Return ONLY valid JSON:
       ],
       "correct_answer": "A",
       "explanation": "Why A is correct",
-      "difficulty": "{difficulty}",
+      "difficulty": "easy",
       "marks": 1
     }}
-  ]
+  ],
+  "medium": [...same shape, "difficulty": "medium"...],
+  "hard": [...same shape, "difficulty": "hard"...]
 }}"""
                     }
                 ]
             )
             
-            result = json.loads(response.choices[0].message.content)
-            return result.get("mcqs", [])
+            result = orjson.loads(response.choices[0].message.content)
+            
+            mcqs_by_difficulty = {}
+            for difficulty in empty:
+                mcqs = [mcq for mcq in result.get(difficulty, []) if isinstance(mcq, dict)]
+                # Keep the difficulty tag on every MCQ even if the model dropped it
+                for mcq in mcqs:
+                    mcq["difficulty"] = difficulty
+                mcqs_by_difficulty[difficulty] = mcqs
+            
+            return mcqs_by_difficulty
         except Exception as e:
-            logger.error(f"MCQ generation failed ({difficulty}): {str(e)[:100]}")
-            return []
+            logger.error(f"MCQ generation failed: {str(e)[:100]}")
+            return empty
     
     @staticmethod
     async def _generate_input_questions(chapter_name: str, board: str, class_: str) -> List:
         """Generate written board exam questions."""
         try:
-            response = await openai_client.chat.completions.create(
+            response = await _create_completion(
                 model="gpt-4o-mini",
                 temperature=0.7,
                 response_format={"type": "json_object"},
@@ -286,7 +349,7 @@ Return ONLY valid JSON:
                 ]
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             return result.get("questions", [])
         except Exception as e:
             logger.error(f"Input questions generation failed: {str(e)[:100]}")
@@ -311,88 +374,49 @@ Return ONLY valid JSON:
         board: str,
         subject: str
     ):
-        """Store all generated content."""
+        """Store all generated content in a single bulk insert."""
         try:
             topic_id = topics[0]["id"] if topics else None
             
-            # Store concept
-            if concept:
-                supabase.table("ai_generated_content").insert({
-                    "id": str(uuid.uuid4()),
-                    "material_id": material_id,
-                    "chapter_id": chapter_id,
-                    "topic_id": topic_id,
-                    "content_type": "concept",
-                    "content": concept,
-                    "board": board,
-                    "subject": subject,
-                    "generated_by_ai": "gpt-4o-mini",
-                    "validation_status": "approved"
-                }).execute()
+            entries = [
+                ("concept", concept, None),
+                ("cheatsheet", cheatsheet, None),
+                ("flashcard", flashcards, None),
+                ("mcq_easy", mcqs_easy, "easy"),
+                ("mcq_medium", mcqs_medium, "medium"),
+                ("mcq_hard", mcqs_hard, "hard"),
+                ("input", input_questions, None),
+            ]
             
-            # Store cheatsheet
-            if cheatsheet:
-                supabase.table("ai_generated_content").insert({
+            rows = [
+                {
                     "id": str(uuid.uuid4()),
                     "material_id": material_id,
                     "chapter_id": chapter_id,
                     "topic_id": topic_id,
-                    "content_type": "cheatsheet",
-                    "content": cheatsheet,
+                    "content_type": content_type,
+                    "content": content,
+                    "difficulty_level": difficulty,
                     "board": board,
                     "subject": subject,
                     "generated_by_ai": "gpt-4o-mini",
                     "validation_status": "approved"
-                }).execute()
+                }
+                for content_type, content, difficulty in entries
+                if content
+            ]
             
-            # Store flashcards
-            if flashcards:
-                supabase.table("ai_generated_content").insert({
-                    "id": str(uuid.uuid4()),
-                    "material_id": material_id,
-                    "chapter_id": chapter_id,
-                    "topic_id": topic_id,
-                    "content_type": "flashcard",
-                    "content": flashcards,
-                    "board": board,
-                    "subject": subject,
-                    "generated_by_ai": "gpt-4o-mini",
-                    "validation_status": "approved"
-                }).execute()
-            
-            # Store MCQs
-            for difficulty, mcqs in [("easy", mcqs_easy), ("medium", mcqs_medium), ("hard", mcqs_hard)]:
-                if mcqs:
-                    supabase.table("ai_generated_content").insert({
-                        "id": str(uuid.uuid4()),
-                        "material_id": material_id,
-                        "chapter_id": chapter_id,
-                        "topic_id": topic_id,
-                        "content_type": f"mcq_{difficulty}",
-                        "content": mcqs,
-                        "difficulty_level": difficulty,
-                        "board": board,
-                        "subject": subject,
-                        "generated_by_ai": "gpt-4o-mini",
-                        "validation_status": "approved"
-                    }).execute()
+            if not rows:
+                logger.warning("No generated content to store")
+                return
             
-            # Store input questions
-            if input_questions:
-                supabase.table("ai_generated_content").insert({
-                    "id": str(uuid.uuid4()),
-                    "material_id": material_id,
-                    "chapter_id": chapter_id,
-                    "topic_id": topic_id,
-                    "content_type": "input",
-                    "content": input_questions,
-                    "board": board,
-                    "subject": subject,
-                    "generated_by_ai": "gpt-4o-mini",
-                    "validation_status": "approved"
-                }).execute()
+            # One round trip for the whole chapter instead of one per content type
+            async with _DB_SEM:
+                await run_in_thread(
+                    lambda: supabase.table("ai_generated_content").insert(rows).execute()
+                )
             
-            logger.info("✅ All content stored successfully")
+            logger.info(f"✅ Stored {len(rows)} content rows")
             
         except Exception as e:
             logger.error(f"Storage failed: {str(e)}")
\ No newline at end of file
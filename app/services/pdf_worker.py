@@ -0,0 +1,47 @@
+"""
+PDF page text extraction (PDFium).
+Kept free of app imports: worker processes are spawned and import this
+module on their own, without the Supabase/Redis clients.
+"""
+
+from typing import List, Iterator
+import logging
+
+import pypdfium2 as pdfium
+
+logger = logging.getLogger(__name__)
+
+
+def iter_page_text(pdf: pdfium.PdfDocument, start: int, stop: int) -> Iterator[str]:
+    """
+    Yield text for pages [start, stop), "" for pages that fail to extract.
+    Each page is closed before moving on so PDFium can free it.
+    """
+    for page_num in range(start, stop):
+        try:
+            page = pdf[page_num]
+            try:
+                textpage = page.get_textpage()
+                # PDFium separates lines with \r\n; normalise for the paragraph chunkers
+                page_text = textpage.get_text_range().replace("\r\n", "\n")
+                textpage.close()
+            finally:
+                page.close()
+        except Exception as e:
+            logger.warning(f"Failed to extract page {page_num}: {str(e)}")
+            page_text = ""
+        yield page_text
+
+
+def extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract text for pages [start, stop) of the PDF at pdf_path.
+    Runs in worker processes (PDFium is not thread-safe, so parallelism has
+    to come from processes); workers open the file themselves instead of
+    being sent the whole document.
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return list(iter_page_text(pdf, start, stop))
+    finally:
+        pdf.close()
@@ -5,23 +5,196 @@ Uses Claude's built-in web_search tool for intelligent question gathering
 """
 
 import asyncio
+import hashlib
 import logging
+import random
 import re
-import json
+import orjson
 import uuid
-from typing import Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Awaitable
 
 import anthropic
+from cachetools import TTLCache
 from app.core.config import settings
-from app.services.ai_service import ContentAI
-from app.db.supabase import supabase
+from app.services.ai_service import ContentAI, ANTHROPIC_SEM
+from app.db.supabase import get_supabase_async
 
 logger = logging.getLogger(__name__)
 
 # Initialize Claude with search capability
-claude_with_search = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+# (SDK retries off: _claude_search already retries 429/503/529 with backoff,
+# and every extra attempt is a billed web search)
+claude_with_search = anthropic.AsyncAnthropic(
+    api_key=settings.ANTHROPIC_API_KEY,
+    max_retries=0
+)
+
+# Max concurrent web-search requests across all chapters
+SEARCH_SEMAPHORE = asyncio.Semaphore(8)
+
+# Web-search results per (chapter, board, class, subject); re-processing
+# the same chapter within a day reuses them instead of searching again
+SEARCH_CACHE_TTL = 86400
+_search_cache: TTLCache = TTLCache(maxsize=2048, ttl=SEARCH_CACHE_TTL)
+
+# Overloaded / rate limited responses worth retrying
+SEARCH_RETRY_STATUSES = (429, 503, 529)
+SEARCH_MAX_ATTEMPTS = 5
+
+# Fixed instructions for the web search; only the chapter details go in the
+# user message
+_SEARCH_SYSTEM_PROMPT = """Search the web and find high-quality educational content for the chapter given by the user (chapter, board, class, subject).
+
+Task:
+1. Search for MCQ questions related to this chapter
+2. Search for Previous Year Questions (PYQs) from the given board's exams
+3. Extract questions in proper format
+4. Validate quality and relevance
+
+Return ONLY valid JSON:
+{
+  "mcqs": [
+    {
+      "question_text": "Clear question text",
+      "options": [
+        {"key": "A", "text": "Option A"},
+        {"key": "B", "text": "Option B"},
+        {"key": "C", "text": "Option C"},
+        {"key": "D", "text": "Option D"}
+      ],
+      "correct_answer": "A",
+      "explanation": "Why this is correct",
+      "source": "URL or source name",
+      "difficulty": "medium"
+    }
+  ],
+  "pyqs": [
+    {
+      "year": "2023",
+      "question": "Question text",
+      "marks": 3,
+      "source": "URL or source name"
+    }
+  ]
+}
+
+Focus on finding REAL exam questions from trusted sources like:
+- CBSE official website
+- NCERT
+- Previous year board papers
+- Reputable education sites (Toppr, Vedantu, Unacademy)
+
+Search and extract at least 10-15 MCQs and 5-10 PYQs.
+"""
+
+# Punctuation/whitespace stripped when comparing question texts
+_NON_WORD_RE = re.compile(r'\W+')
+
+
+class _JsonObjectScanner:
+    """
+    Tracks brace depth over streamed text, ignoring braces inside JSON
+    strings, so we can stop reading once the answer object is complete.
+    """
+    
+    def __init__(self):
+        self.pos = 0
+        self.start = -1
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, text: str) -> List[tuple]:
+        """Scan the next delta; return (start, end) offsets of top-level objects closed in it."""
+        closed = []
+        for ch in text:
+            self.pos += 1
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == "{":
+                if self.depth == 0:
+                    self.start = self.pos - 1
+                self.depth += 1
+            elif ch == "}" and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0:
+                    closed.append((self.start, self.pos))
+            elif ch == '"' and self.depth > 0:
+                self.in_string = True
+        return closed
+
+
+def _extract_json(text: str) -> Optional[Dict]:
+    """
+    Return the first balanced top-level JSON object in text that parses,
+    skipping prose and stray braces around it. One linear pass.
+    """
+    for start, end in _JsonObjectScanner().feed(text):
+        try:
+            candidate = orjson.loads(text[start:end])
+        except ValueError:
+            continue
+        if isinstance(candidate, dict):
+            return candidate
+    return None
+
+
+def _search_backoff(attempt: int) -> float:
+    """Exponential backoff with jitter, capped at 60s."""
+    base = 2 ** attempt
+    jitter = random.uniform(0, base * 0.1)
+    return min(base + jitter, 60)
+
+
+def _dedupe_mcqs(mcqs: List[Dict]) -> List[Dict]:
+    """
+    Drop MCQs whose question text repeats an earlier one, ignoring case,
+    spacing and punctuation (web search often finds the same question on
+    several sites).
+    """
+    seen = set()
+    unique = []
+    
+    for mcq in mcqs:
+        normalized = _NON_WORD_RE.sub("", str(mcq.get("question_text", "")).lower())
+        if normalized:
+            digest = hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+        unique.append(mcq)
+    
+    return unique
+
+
+async def _await_labelled(calls: Dict[str, Awaitable]) -> Dict[str, Any]:
+    """
+    Await labelled calls as they finish.
+    
+    Returns results keyed by label; failed calls are logged and left out,
+    so callers fall back with ``results.get(label, default)``.
+    """
+    tasks = {asyncio.ensure_future(aw): label for label, aw in calls.items()}
+    results = {}
+    pending = set(tasks)
+    
+    # asyncio.wait rather than as_completed: it hands back the original
+    # tasks, so each result can be matched to its label
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            label = tasks[task]
+            try:
+                results[label] = task.result()
+            except Exception as e:
+                logger.warning(f"{label} generation failed: {str(e)[:100]}")
+    
+    return results
 
 
 class SmartHybridGeneratorV2:
@@ -58,6 +231,19 @@ class SmartHybridGeneratorV2:
         try:
             logger.info(f"🔍 Smart search for: {chapter_name}")
             
+            topics_summary = ", ".join([t.get("topic_name", "") for t in topics[:8]])
+            
+            # Study materials and input questions don't depend on the search
+            # results, so start them now and let them run during Phase 1
+            study_future = asyncio.ensure_future(_await_labelled({
+                "concept": ContentAI.generate_concept(chapter_name, topics_summary, "en"),
+                "cheatsheet": ContentAI.generate_cheatsheet(chapter_name, topics_summary, "en"),
+                "flashcards": ContentAI.generate_flashcards(chapter_name, topics_summary, "en")
+            }))
+            input_task = asyncio.create_task(
+                ContentAI.generate_input_questions(chapter_name, board, class_, "en")
+            )
+            
             # PHASE 1: INTELLIGENT WEB SEARCH
             logger.info("📡 Phase 1: Claude searching web for questions...")
             
@@ -76,22 +262,14 @@ class SmartHybridGeneratorV2:
                 f"{len(scraped_pyqs)} PYQs from web"
             )
             
-            # PHASE 2: AI STUDY MATERIALS (Parallel)
-            logger.info("🤖 Phase 2: Generating study materials...")
-            
-            topics_summary = ", ".join([t.get("topic_name", "") for t in topics[:8]])
-            
-            study_tasks = [
-                ContentAI.generate_concept(chapter_name, topics_summary, "en"),
-                ContentAI.generate_cheatsheet(chapter_name, topics_summary, "en"),
-                ContentAI.generate_flashcards(chapter_name, topics_summary, "en")
-            ]
+            # PHASE 2: AI STUDY MATERIALS (started alongside the search)
+            logger.info("🤖 Phase 2: Collecting study materials...")
             
-            study_results = await asyncio.gather(*study_tasks, return_exceptions=True)
+            study_results = await study_future
             
-            concept = study_results[0] if not isinstance(study_results[0], Exception) else {}
-            cheatsheet = study_results[1] if not isinstance(study_results[1], Exception) else {}
-            flashcards = study_results[2] if not isinstance(study_results[2], Exception) else []
+            concept = study_results.get("concept", {})
+            cheatsheet = study_results.get("cheatsheet", {})
+            flashcards = study_results.get("flashcards", [])
             
             logger.info(
                 f"✅ Generated study materials: Concept, Cheatsheet, "
@@ -106,10 +284,18 @@ class SmartHybridGeneratorV2:
                 scraped_mcqs=scraped_mcqs,
                 board=board,
                 class_=class_,
-                subject=subject
+                subject=subject,
+                input_task=input_task
             )
             
             total_mcqs = sum(len(v) for v in mcqs_by_difficulty.values())
+            # Count from the final (deduplicated, capped) lists; anything not
+            # taken from the search results was generated by AI
+            scraped_ids = {id(mcq) for mcq in scraped_mcqs}
+            ai_mcqs = sum(
+                1 for mcq_list in mcqs_by_difficulty.values()
+                for mcq in mcq_list if id(mcq) not in scraped_ids
+            )
             logger.info(f"✅ Total MCQs: {total_mcqs}, Input Questions: {len(input_questions)}")
             
             # PHASE 4: STORE EVERYTHING
@@ -135,7 +321,7 @@ class SmartHybridGeneratorV2:
                 "chapter_name": chapter_name,
                 "web_searched_mcqs": len(scraped_mcqs),
                 "web_searched_pyqs": len(scraped_pyqs),
-                "ai_generated_mcqs": total_mcqs - len(scraped_mcqs),
+                "ai_generated_mcqs": ai_mcqs,
                 "flashcards": len(flashcards) if isinstance(flashcards, list) else 0,
                 "stored_items": sum(stored.values()),
                 "method": "claude_web_search"
@@ -162,16 +348,26 @@ class SmartHybridGeneratorV2:
         Use Claude's web_search to find questions.
         Claude intelligently searches, extracts, and validates.
         """
+        key = (chapter_name.strip().lower(), board, class_, subject)
+        
+        cached = _search_cache.get(key)
+        if cached is not None:
+            logger.info(f"Claude search cache hit for {chapter_name}")
+            # Copies, so callers can't mutate the cached lists
+            return {"mcqs": list(cached["mcqs"]), "pyqs": list(cached["pyqs"])}
+        
         try:
-            loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(
-                SEARCH_EXECUTOR,
-                SmartHybridGeneratorV2._claude_search_sync,
+            result = await SmartHybridGeneratorV2._claude_search(
                 chapter_name,
                 board,
                 class_,
                 subject
             )
+            
+            # Only cache successful searches so failures are retried next time
+            if result["mcqs"] or result["pyqs"]:
+                _search_cache[key] = {"mcqs": list(result["mcqs"]), "pyqs": list(result["pyqs"])}
+            
             return result
             
         except Exception as e:
@@ -179,88 +375,83 @@ class SmartHybridGeneratorV2:
             return {"mcqs": [], "pyqs": []}
     
     @staticmethod
-    def _claude_search_sync(
+    async def _claude_search(
         chapter_name: str,
         board: str,
         class_: str,
         subject: str
     ) -> Dict[str, List]:
         """
-        Synchronous Claude search with tool use.
+        Claude search with tool use (async client, no thread hop).
         """
         try:
-            prompt = f"""Search the web and find high-quality educational content for:
-
-Chapter: {chapter_name}
-Board: {board}
-Class: {class_}
-Subject: {subject}
-
-Task:
-1. Search for MCQ questions related to this chapter
-2. Search for Previous Year Questions (PYQs) from {board} board exams
-3. Extract questions in proper format
-4. Validate quality and relevance
-
-Return ONLY valid JSON:
-{{
-  "mcqs": [
-    {{
-      "question_text": "Clear question text",
-      "options": [
-        {{"key": "A", "text": "Option A"}},
-        {{"key": "B", "text": "Option B"}},
-        {{"key": "C", "text": "Option C"}},
-        {{"key": "D", "text": "Option D"}}
-      ],
-      "correct_answer": "A",
-      "explanation": "Why this is correct",
-      "source": "URL or source name",
-      "difficulty": "medium"
-    }}
-  ],
-  "pyqs": [
-    {{
-      "year": "2023",
-      "question": "Question text",
-      "marks": 3,
-      "source": "URL or source name"
-    }}
-  ]
-}}
-
-Focus on finding REAL exam questions from trusted sources like:
-- CBSE official website
-- NCERT
-- Previous year board papers
-- Reputable education sites (Toppr, Vedantu, Unacademy)
-
-Search and extract at least 10-15 MCQs and 5-10 PYQs.
-"""
-            
-            # Use Claude with tools enabled
-            message = claude_with_search.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8000,
-                temperature=0.3,
-                tools=[{
-                    "type": "web_search_20250305",
-                    "name": "web_search"
-                }],
-                messages=[{"role": "user", "content": prompt}]
+            prompt = (
+                f"Chapter: {chapter_name}\n"
+                f"Board: {board}\n"
+                f"Class: {class_}\n"
+                f"Subject: {subject}"
             )
             
-            # Extract content from response
-            full_text = ""
-            for block in message.content:
-                if hasattr(block, 'text'):
-                    full_text += block.text
+            # Stream with tools enabled, backing off on 429/529/503
+            for attempt in range(SEARCH_MAX_ATTEMPTS):
+                parts: List[str] = []
+                result = None
+                scanner = _JsonObjectScanner()
+                try:
+                    async with SEARCH_SEMAPHORE, ANTHROPIC_SEM:
+                        async with claude_with_search.messages.stream(
+                            model=settings.CLAUDE_SEARCH_MODEL,
+                            max_tokens=4096,
+                            temperature=0.3,
+                            system=_SEARCH_SYSTEM_PROMPT,
+                            tools=[{
+                                "type": "web_search_20250305",
+                                "name": "web_search"
+                            }],
+                            messages=[{"role": "user", "content": prompt}]
+                        ) as stream:
+                            async for text in stream.text_stream:
+                                parts.append(text)
+                                closed = scanner.feed(text)
+                                if not closed:
+                                    continue
+                                
+                                # Stop as soon as the answer object closes;
+                                # anything after it is never used
+                                buffered = "".join(parts)
+                                for start, end in closed:
+                                    try:
+                                        candidate = orjson.loads(buffered[start:end])
+                                    except ValueError:
+                                        continue
+                                    if isinstance(candidate, dict) and (
+                                        "mcqs" in candidate or "pyqs" in candidate
+                                    ):
+                                        result = candidate
+                                        break
+                                if result is not None:
+                                    break
+                    break
+                except anthropic.APIStatusError as e:
+                    # RateLimitError is an APIStatusError with status 429
+                    if (
+                        e.status_code not in SEARCH_RETRY_STATUSES
+                        or attempt == SEARCH_MAX_ATTEMPTS - 1
+                    ):
+                        raise
+                    delay = _search_backoff(attempt)
+                    logger.warning(
+                        f"Claude search returned {e.status_code}, "
+                        f"retrying in {delay:.1f}s ({attempt + 1}/{SEARCH_MAX_ATTEMPTS})"
+                    )
+                    await asyncio.sleep(delay)
             
-            # Parse JSON from response
-            json_match = re.search(r'(\{[\s\S]*\})', full_text)
-            if json_match:
-                result = json.loads(json_match.group(1))
-                
+            if result is None:
+                # Stream ended without a recognisable object; take the first
+                # balanced object in the full text
+                result = _extract_json("".join(parts))
+            
+            if result is not None:
                 # Validate and clean
                 mcqs = result.get("mcqs", [])[:15]  # Limit to 15
                 pyqs = result.get("pyqs", [])[:10]  # Limit to 10
@@ -276,7 +467,7 @@ Search and extract at least 10-15 MCQs and 5-10 PYQs.
                 return {"mcqs": [], "pyqs": []}
             
         except Exception as e:
-            logger.error(f"Claude search sync failed: {str(e)[:200]}")
+            logger.error(f"Claude search failed: {str(e)[:200]}")
             return {"mcqs": [], "pyqs": []}
     
     # ================================================================
@@ -289,54 +480,53 @@ Search and extract at least 10-15 MCQs and 5-10 PYQs.
         scraped_mcqs: List[Dict],
         board: str,
         class_: str,
-        subject: str
+        subject: str,
+        input_task: Optional[asyncio.Task] = None
     ) -> tuple:
         """
         Claude analyzes what's missing and generates to fill gaps.
+        
+        input_task, if given, is an already running input-question
+        generation to use instead of starting a new one.
         """
         try:
-            # Categorize scraped MCQs by difficulty
+            # Categorize unique scraped MCQs by difficulty, so duplicates
+            # don't count towards the per-difficulty targets
             mcqs_by_diff = {"easy": [], "medium": [], "hard": []}
             
-            for mcq in scraped_mcqs:
+            for mcq in _dedupe_mcqs(scraped_mcqs):
                 diff = mcq.get("difficulty", "medium")
                 if diff in mcqs_by_diff:
                     mcqs_by_diff[diff].append(mcq)
             
-            # Determine what's needed
+            # Determine what's needed; only difficulties short of the
+            # target get a generation call
             target_per_diff = 15
-            tasks = []
+            tasks_by_diff = {}
             
             for difficulty in ["easy", "medium", "hard"]:
                 current = len(mcqs_by_diff[difficulty])
                 if current < target_per_diff:
                     needed = target_per_diff - current
                     logger.info(f"Generating {needed} {difficulty} MCQs")
-                    tasks.append(
-                        ContentAI.generate_mcqs(chapter_name, board, class_, difficulty, "en")
+                    tasks_by_diff[difficulty] = ContentAI.generate_mcqs(
+                        chapter_name, board, class_, difficulty, "en"
                     )
-                else:
-                    tasks.append(asyncio.sleep(0))  # Placeholder
             
             # Always generate input questions
-            tasks.append(
-                ContentAI.generate_input_questions(chapter_name, board, class_, "en")
-            )
+            if input_task is None:
+                input_task = ContentAI.generate_input_questions(chapter_name, board, class_, "en")
             
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await _await_labelled({**tasks_by_diff, "input": input_task})
             
             # Merge results
-            idx = 0
-            for difficulty in ["easy", "medium", "hard"]:
-                if len(mcqs_by_diff[difficulty]) < target_per_diff:
-                    if not isinstance(results[idx], Exception) and isinstance(results[idx], list):
-                        needed = target_per_diff - len(mcqs_by_diff[difficulty])
-                        mcqs_by_diff[difficulty].extend(results[idx][:needed])
-                    idx += 1
-                else:
-                    idx += 1
+            for difficulty in tasks_by_diff:
+                generated = results.get(difficulty)
+                if isinstance(generated, list):
+                    needed = target_per_diff - len(mcqs_by_diff[difficulty])
+                    mcqs_by_diff[difficulty].extend(generated[:needed])
             
-            input_questions = results[-1] if not isinstance(results[-1], Exception) else []
+            input_questions = results.get("input", [])
             
             return mcqs_by_diff, input_questions
             
@@ -374,123 +564,82 @@ Search and extract at least 10-15 MCQs and 5-10 PYQs.
         }
         
         try:
-            topic_id = topics[0]["id"] if topics else None
+            base = {
+                "material_id": material_id,
+                "chapter_id": chapter_id,
+                "topic_id": topics[0]["id"] if topics else None,
+                "board": board,
+                "subject": subject,
+                "generated_by_ai": "claude-smart-search",
+                "validation_status": "approved",
+                # Bulk inserts need the same keys on every row
+                "difficulty_level": None
+            }
+            
+            # (stored counter, items counted, row payload)
+            entries = []
             
-            # Store concept
             if concept:
-                try:
-                    supabase.table("ai_generated_content").insert({
-                        "id": str(uuid.uuid4()),
-                        "material_id": material_id,
-                        "chapter_id": chapter_id,
-                        "topic_id": topic_id,
-                        "content_type": "concept",
-                        "content": concept,
-                        "board": board,
-                        "subject": subject,
-                        "generated_by_ai": "claude-smart-search",
-                        "validation_status": "approved"
-                    }).execute()
-                    stored["concepts"] = 1
-                except Exception as e:
-                    logger.warning(f"Failed to store concept: {str(e)[:100]}")
-            
-            # Store cheatsheet
+                entries.append(("concepts", 1, {**base, "content_type": "concept", "content": concept}))
             if cheatsheet:
-                try:
-                    supabase.table("ai_generated_content").insert({
-                        "id": str(uuid.uuid4()),
-                        "material_id": material_id,
-                        "chapter_id": chapter_id,
-                        "topic_id": topic_id,
-                        "content_type": "cheatsheet",
-                        "content": cheatsheet,
-                        "board": board,
-                        "subject": subject,
-                        "generated_by_ai": "claude-smart-search",
-                        "validation_status": "approved"
-                    }).execute()
-                    stored["cheatsheets"] = 1
-                except Exception as e:
-                    logger.warning(f"Failed to store cheatsheet: {str(e)[:100]}")
-            
-            # Store flashcards
+                entries.append(("cheatsheets", 1, {**base, "content_type": "cheatsheet", "content": cheatsheet}))
             if flashcards:
-                try:
-                    supabase.table("ai_generated_content").insert({
-                        "id": str(uuid.uuid4()),
-                        "material_id": material_id,
-                        "chapter_id": chapter_id,
-                        "topic_id": topic_id,
-                        "content_type": "flashcard",
-                        "content": flashcards,
-                        "board": board,
-                        "subject": subject,
-                        "generated_by_ai": "claude-smart-search",
-                        "validation_status": "approved"
-                    }).execute()
-                    stored["flashcards"] = len(flashcards) if isinstance(flashcards, list) else 0
-                except Exception as e:
-                    logger.warning(f"Failed to store flashcards: {str(e)[:100]}")
-            
-            # Store MCQs
+                entries.append((
+                    "flashcards",
+                    len(flashcards) if isinstance(flashcards, list) else 0,
+                    {**base, "content_type": "flashcard", "content": flashcards}
+                ))
             for difficulty, mcq_list in mcqs_by_difficulty.items():
                 if mcq_list:
-                    try:
-                        supabase.table("ai_generated_content").insert({
-                            "id": str(uuid.uuid4()),
-                            "material_id": material_id,
-                            "chapter_id": chapter_id,
-                            "topic_id": topic_id,
-                            "content_type": f"mcq_{difficulty}",
-                            "content": mcq_list,
-                            "difficulty_level": difficulty,
-                            "board": board,
-                            "subject": subject,
-                            "generated_by_ai": "claude-smart-search",
-                            "validation_status": "approved"
-                        }).execute()
-                        stored["mcqs"] += len(mcq_list)
-                    except Exception as e:
-                        logger.warning(f"Failed to store {difficulty} MCQs: {str(e)[:100]}")
-            
-            # Store PYQs
+                    entries.append((
+                        "mcqs",
+                        len(mcq_list),
+                        {**base, "content_type": f"mcq_{difficulty}", "content": mcq_list, "difficulty_level": difficulty}
+                    ))
             if pyqs:
-                try:
-                    supabase.table("ai_generated_content").insert({
-                        "id": str(uuid.uuid4()),
-                        "material_id": material_id,
-                        "chapter_id": chapter_id,
-                        "topic_id": topic_id,
-                        "content_type": "pyq",
-                        "content": pyqs,
-                        "board": board,
-                        "subject": subject,
-                        "generated_by_ai": "web-search-claude",
-                        "validation_status": "approved"
-                    }).execute()
-                    stored["pyqs"] = len(pyqs)
-                except Exception as e:
-                    logger.warning(f"Failed to store PYQs: {str(e)[:100]}")
-            
-            # Store input questions
+                entries.append((
+                    "pyqs",
+                    len(pyqs),
+                    {**base, "content_type": "pyq", "content": pyqs, "generated_by_ai": "web-search-claude"}
+                ))
             if input_questions:
-                try:
-                    supabase.table("ai_generated_content").insert({
-                        "id": str(uuid.uuid4()),
-                        "material_id": material_id,
-                        "chapter_id": chapter_id,
-                        "topic_id": topic_id,
-                        "content_type": "input",
-                        "content": input_questions,
-                        "board": board,
-                        "subject": subject,
-                        "generated_by_ai": "claude-smart-search",
-                        "validation_status": "approved"
-                    }).execute()
-                    stored["input_questions"] = len(input_questions) if isinstance(input_questions, list) else 0
-                except Exception as e:
-                    logger.warning(f"Failed to store input questions: {str(e)[:100]}")
+                entries.append((
+                    "input_questions",
+                    len(input_questions) if isinstance(input_questions, list) else 0,
+                    {**base, "content_type": "input", "content": input_questions}
+                ))
+            
+            if not entries:
+                return stored
+            
+            for _, _, payload in entries:
+                payload["id"] = str(uuid.uuid4())
+            
+            db = await get_supabase_async()
+            
+            try:
+                # One bulk insert: a single round trip and transaction
+                await db.table("ai_generated_content").insert(
+                    [payload for _, _, payload in entries]
+                ).execute()
+                for key, count, _ in entries:
+                    stored[key] += count
+            except Exception as e:
+                logger.warning(f"Bulk insert failed, retrying per row: {str(e)[:100]}")
+                
+                results = await asyncio.gather(
+                    *(
+                        db.table("ai_generated_content").insert(payload).execute()
+                        for _, _, payload in entries
+                    ),
+                    return_exceptions=True
+                )
+                
+                for (key, count, payload), result in zip(entries, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Failed to store {payload['content_type']}: {str(result)[:100]}")
+                    else:
+                        stored[key] += count
             
             return stored
             
@@ -515,14 +664,12 @@ Search and extract at least 10-15 MCQs and 5-10 PYQs.
         """Pure AI generation as last resort."""
         logger.warning(f"Using pure AI fallback for {chapter_name}")
         
-        tasks = [
-            ContentAI.generate_concept(chapter_name, "", "en"),
-            ContentAI.generate_cheatsheet(chapter_name, "", "en"),
-            ContentAI.generate_flashcards(chapter_name, "", "en"),
-            ContentAI.generate_mcqs(chapter_name, board, class_, "medium", "en")
-        ]
-        
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await _await_labelled({
+            "concept": ContentAI.generate_concept(chapter_name, "", "en"),
+            "cheatsheet": ContentAI.generate_cheatsheet(chapter_name, "", "en"),
+            "flashcards": ContentAI.generate_flashcards(chapter_name, "", "en"),
+            "mcq_medium": ContentAI.generate_mcqs(chapter_name, board, class_, "medium", "en")
+        })
         
         return {
             "chapter_name": chapter_name,
@@ -1,27 +1,54 @@
-# app/services/text_chunker.py
+from bisect import bisect_left
 from typing import List
-import re
 
 MAX_CHARS = 12000   # Safe for GLM-4.5
 
+
+def _collapse_newlines(text: str) -> str:
+    """Collapse runs of 3+ newlines to exactly two (C-speed str.replace passes)."""
+    while "\n\n\n" in text:
+        text = text.replace("\n\n\n", "\n\n")
+    return text
+
+
 def smart_chunk_text(text: str) -> List[str]:
     """
     Splits textbook into logical readable chunks (not dumb slicing).
     Keeps paragraphs intact.
     """
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    paragraphs = text.split("\n\n")
+    text = _collapse_newlines(text)
+
+    # After collapsing, paragraphs are separated by exactly "\n\n", so
+    # cum[i] is both the offset of paragraph i in `text` and the length of
+    # paragraphs[:i] including a "\n\n" after each one. Chunks are sliced
+    # straight out of `text`; no paragraph list or joined copies are built.
+    cum = [0]
+    sep = text.find("\n\n")
+    while sep != -1:
+        cum.append(sep + 2)
+        sep = text.find("\n\n", sep + 2)
+    cum.append(len(text) + 2)
+    n = len(cum) - 1
+
+    # Paragraph j fits in a chunk starting at `start` while
+    # cum[j + 1] - 2 - cum[start] < MAX_CHARS, so each cut point is a
+    # binary search over the offsets instead of a per-paragraph loop.
+    chunks: List[str] = []
+    start = 0
 
-    chunks, current = [], ""
+    while start < n:
+        end = bisect_left(cum, cum[start] + MAX_CHARS + 2, lo=start + 1) - 1
+        end = max(end, start + 1)   # always take at least one paragraph
 
-    for p in paragraphs:
-        if len(current) + len(p) < MAX_CHARS:
-            current += p + "\n\n"
-        else:
-            chunks.append(current.strip())
-            current = p + "\n\n"
+        # Trim surrounding whitespace by moving the bounds, not via strip()
+        lo, hi = cum[start], cum[end] - 2
+        while lo < hi and text[lo].isspace():
+            lo += 1
+        while hi > lo and text[hi - 1].isspace():
+            hi -= 1
 
-    if current.strip():
-        chunks.append(current.strip())
+        if lo < hi or end < n:
+            chunks.append(text[lo:hi])
+        start = end
 
     return chunks
@@ -4,11 +4,17 @@ Handles user profile management, statistics, and admin operations.
 """
 
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
 import logging
 
+from cachetools import TTLCache
+from postgrest.exceptions import APIError
+
 from app.core.errors import NotFoundError, ValidationError, AuthorizationError
-from app.db.supabase import supabase
+from app.db.supabase import supabase, run_in_thread
+from app.db.pool import get_pool
+from app.db.redis import UserCache, AdminCache
 from app.models.user import (
     UserProfileUpdate,
     UserProfileResponse,
@@ -23,6 +29,130 @@ from app.models.auth import UserResponse
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# COLUMN PROJECTIONS
+# ============================================================================
+
+# UserProfileResponse fields stored on user_profiles (students only)
+PROFILE_COLUMNS = (
+    "school_name",
+    "board",
+    "subjects",
+    "study_hours_per_day",
+    "preferred_study_time",
+    "target_score",
+    "exam_date",
+)
+
+# Only fetch the columns the response models read, not SELECT *.
+# board lives on both tables (users keeps it for non-students).
+USER_COLUMNS = tuple(
+    field for field in UserProfileResponse.model_fields
+    if field == "board"
+    or (field not in PROFILE_COLUMNS and field not in UserStatsResponse.model_fields)
+)
+STATS_COLUMNS = tuple(UserStatsResponse.model_fields)
+
+# Stats for users without a user_stats row yet (or when the read fails)
+_EMPTY_STATS = UserStatsResponse(
+    total_study_time_minutes=0,
+    total_questions_attempted=0,
+    total_questions_correct=0,
+    accuracy_percentage=0.0,
+    current_streak_days=0,
+    longest_streak_days=0,
+    total_sessions=0,
+    achievements_earned=0
+)
+
+# users columns a profile edit may write (grade_level is locked after
+# profile completion and is never written from here)
+USER_UPDATE_FIELDS = frozenset(UserProfileUpdate.model_fields) - {"grade_level"}
+
+# Static PostgREST select/update payloads (never mutated)
+LOCK_CHECK_COLUMNS = "profile_completed"
+ACTIVATE_PAYLOAD = {"is_active": True}
+DEACTIVATE_PAYLOAD = {"is_active": False}
+
+# Related rows joined into the admin user list, so callers never need a
+# per-user follow-up query
+LIST_JOINS = {
+    "user_profiles": ("school_name", "board", "subjects"),
+    "user_stats": ("total_questions_attempted", "accuracy_percentage"),
+}
+LIST_COLUMNS = tuple(
+    field for field in UserListItem.model_fields
+    if not any(field in cols for cols in LIST_JOINS.values())
+)
+
+
+def _select_list(table: str, columns: tuple, prefix: str = "") -> str:
+    """Qualified column list; uuid ids are cast to text for the str models."""
+    return ", ".join(
+        f"{table}.id::text AS id" if column == "id"
+        else f"{table}.{column} AS {prefix}{column}"
+        for column in columns
+    )
+
+
+# ============================================================================
+# SQL (hot read paths, run on the asyncpg pool)
+# ============================================================================
+
+# Built once at import so every call sends byte-identical SQL; with
+# DB_STATEMENT_CACHE_SIZE > 0 asyncpg reuses each connection's prepared
+# statement (and plan) instead of re-parsing.
+
+PROFILE_SQL = (
+    f"SELECT {_select_list('users', USER_COLUMNS)}, "
+    f"user_profiles.user_id IS NOT NULL AS has_profile, "
+    f"{_select_list('user_profiles', PROFILE_COLUMNS, prefix='profile_')} "
+    "FROM users "
+    "LEFT JOIN user_profiles ON user_profiles.user_id = users.id "
+    "WHERE users.id = $1"
+)
+
+# Non-students have no academic profile, so their reads skip the join
+USER_SQL = (
+    f"SELECT {_select_list('users', USER_COLUMNS)} "
+    "FROM users WHERE users.id = $1"
+)
+
+# Aggregates are NULL for users with no sessions/attempts yet; fall back to
+# the same zeros as _EMPTY_STATS so the row always validates
+STATS_SQL = (
+    "SELECT "
+    + ", ".join(
+        f"COALESCE({column}, {getattr(_EMPTY_STATS, column)!r}) AS {column}"
+        for column in STATS_COLUMNS
+    )
+    + " FROM user_stats WHERE user_id = $1"
+)
+
+USERS_LIST_SQL = (
+    f"SELECT {_select_list('users', LIST_COLUMNS)}, "
+    + ", ".join(_select_list(table, cols) for table, cols in LIST_JOINS.items())
+    + " FROM users "
+    + " ".join(f"LEFT JOIN {table} ON {table}.user_id = users.id" for table in LIST_JOINS)
+    + " WHERE ($1::text IS NULL OR users.role::text = $1)"
+    # Keyset cursor: rows strictly after (created_at, id) of the previous page
+    " AND ($2::timestamptz IS NULL OR (users.created_at, users.id) < ($2::timestamptz, $3::uuid))"
+    " ORDER BY users.created_at DESC, users.id DESC"
+    " LIMIT $4 OFFSET $5"
+)
+
+USERS_COUNT_SQL = "SELECT count(*) FROM users WHERE ($1::text IS NULL OR role::text = $1)"
+
+# Planner row estimate (-1 until the table has been analyzed)
+USERS_ESTIMATE_SQL = "SELECT reltuples::bigint FROM pg_class WHERE oid = 'public.users'::regclass"
+
+
+# Roles practically never change, so a process-local map is enough to pick
+# the cheaper query without a Redis or DB probe
+ROLE_CACHE_TTL = 300
+_ROLE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=ROLE_CACHE_TTL)
+
+
 # ============================================================================
 # USER SERVICE
 # ============================================================================
@@ -47,16 +177,30 @@ class UserService:
             ValidationError: If profile already completed or update fails
         """
         try:
-            # Check if profile already completed
-            user_result = supabase.table("users").select("profile_completed, grade_level, board").eq("id", user_id).execute()
+            # Lock check, both updates and the re-read run server-side in
+            # one transaction (supabase/migrations/*_complete_profile_*.sql).
+            # Retrying with an identical payload returns the profile without
+            # writing anything.
+            result = await run_in_thread(
+                lambda: supabase.rpc(
+                    "complete_profile",
+                    {"uid": user_id, "payload": data.model_dump(mode="json")}
+                ).execute()
+            )
             
-            if not user_result.data:
-                raise NotFoundError(resource="User")
+            profile = UserService._build_profile(
+                result.data["user"], result.data["profile"]
+            )
+            await UserCache.set_profile(user_id, profile.model_dump(mode="json"))
             
-            user = user_result.data[0]
+            logger.info(f"Profile completed for user: {user_id} (Grade: {data.grade_level}, Board: {data.board})")
             
-            # If profile already completed, don't allow changes to grade/board
-            if user.get("profile_completed"):
+            return profile
+            
+        except APIError as e:
+            if e.code == "P0002":
+                raise NotFoundError(resource="User")
+            if e.code == "P0001":
                 raise ValidationError(
                     message="Profile already completed. Grade and board are locked.",
                     details={
@@ -64,37 +208,11 @@ class UserService:
                         "contact": "Contact admin to change these fields"
                     }
                 )
-            
-            # Update users table
-            user_updates = {
-                "grade_level": data.grade_level,
-                "board": data.board,
-                "preferred_language": data.preferred_language,
-                "target_exam": data.target_exam,
-                "profile_completed": True,
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            supabase.table("users").update(user_updates).eq("id", user_id).execute()
-            
-            # Update user_profiles table (if student)
-            profile_updates = {
-                "school_name": data.school_name,
-                "board": data.board,
-                "subjects": data.subjects,
-                "study_hours_per_day": data.study_hours_per_day,
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            supabase.table("user_profiles").update(profile_updates).eq("user_id", user_id).execute()
-            
-            logger.info(f"Profile completed for user: {user_id} (Grade: {data.grade_level}, Board: {data.board})")
-            
-            # Return updated profile
-            return await UserService.get_user_profile(user_id)
-            
-        except (NotFoundError, ValidationError):
-            raise
+            logger.error(f"Complete profile error: {str(e)}", exc_info=True)
+            raise ValidationError(
+                message="Failed to complete profile",
+                details={"error": str(e)}
+            )
         except Exception as e:
             logger.error(f"Complete profile error: {str(e)}", exc_info=True)
             raise ValidationError(
@@ -102,6 +220,48 @@ class UserService:
                 details={"error": str(e)}
             )
     
+    @staticmethod
+    def _build_profile(user: dict, profile_row: Optional[dict]) -> UserProfileResponse:
+        """
+        Build the profile response from a users row and its user_profiles row.
+        
+        Args:
+            user: users columns
+            profile_row: user_profiles columns, or None if there is no row
+        
+        Returns:
+            User profile (academic fields only filled in for students)
+        """
+        # Use profile data (if student)
+        profile_data = {}
+        if user.get("role") == "student" and profile_row:
+            profile_data = {column: profile_row.get(column) for column in PROFILE_COLUMNS}
+        
+        # Merge user and profile data
+        return UserProfileResponse(**{**user, **profile_data})
+    
+    @staticmethod
+    async def _profile_after_user_update(user_id: str, rows: list) -> UserProfileResponse:
+        """
+        Build the profile response from the users row an UPDATE returned.
+        
+        Args:
+            user_id: User ID
+            rows: Rows returned by the users UPDATE
+        
+        Returns:
+            Updated user profile
+        """
+        # Non-students have nothing to join, so the returned row is the
+        # whole profile; students still need their user_profiles row
+        if rows and rows[0].get("role") != "student":
+            profile = UserService._build_profile(rows[0], None)
+            await UserCache.set_profile(user_id, profile.model_dump(mode="json"))
+            return profile
+        
+        await UserCache.delete_profile(user_id)
+        return await UserService.get_user_profile(user_id)
+    
     @staticmethod
     async def get_user_profile(user_id: str) -> UserProfileResponse:
         """
@@ -117,26 +277,34 @@ class UserService:
             NotFoundError: If user not found
         """
         try:
-            # Get user data
-            user_result = supabase.table("users").select("*").eq("id", user_id).execute()
+            cached = await UserCache.get_profile(user_id)
+            if cached is not None:
+                return UserProfileResponse.model_validate(cached)
+            
+            # One query on a pooled connection: user row + profile row
+            # (just the user row for known non-students)
+            role = _ROLE_CACHE.get(user_id)
+            sql = USER_SQL if role is not None and role != "student" else PROFILE_SQL
             
-            if not user_result.data:
+            pool = await get_pool()
+            async with pool.acquire() as conn:
+                row = await conn.fetchrow(sql, user_id)
+            
+            if row is None:
                 raise NotFoundError(resource="User")
             
-            user = user_result.data[0]
+            user = dict(row)
+            _ROLE_CACHE[user_id] = user["role"]
             
-            # Get profile data (if student)
-            profile_data = {}
-            if user.get("role") == "student":
-                profile_result = supabase.table("user_profiles").select("*").eq("user_id", user_id).execute()
-                
-                if profile_result.data:
-                    profile_data = profile_result.data[0]
+            has_profile = user.pop("has_profile", False)
+            profile_row = {
+                column: user.pop(f"profile_{column}", None) for column in PROFILE_COLUMNS
+            }
             
-            # Merge user and profile data
-            combined_data = {**user, **profile_data}
+            profile = UserService._build_profile(user, profile_row if has_profile else None)
+            await UserCache.set_profile(user_id, profile.model_dump(mode="json"))
             
-            return UserProfileResponse(**combined_data)
+            return profile
             
         except NotFoundError:
             raise
@@ -161,44 +329,27 @@ class UserService:
             ValidationError: If trying to change locked fields
         """
         try:
-            # Check if user is trying to change locked fields
-            user_check = supabase.table("users").select("profile_completed, grade_level, board").eq("id", user_id).execute()
-            
-            if user_check.data and user_check.data[0].get("profile_completed"):
-                # Profile is completed - grade_level and board are locked
-                if data.grade_level is not None:
+            # Check if user is trying to change locked fields (only needed
+            # when the request actually touches grade_level)
+            if data.grade_level is not None:
+                user_check = supabase.table("users").select(LOCK_CHECK_COLUMNS).eq("id", user_id).execute()
+                
+                if user_check.data and user_check.data[0].get("profile_completed"):
+                    # Profile is completed - grade_level and board are locked
                     raise ValidationError(
                         message="Cannot change grade level after profile completion",
                         details={"locked_field": "grade_level", "contact_admin": True}
                     )
             
-            # Prepare update data (only non-None fields)
-            user_updates = {}
-            profile_updates = {}
-            
-            # Fields that go in users table
-            if data.full_name is not None:
-                user_updates["full_name"] = data.full_name
-            if data.phone is not None:
-                user_updates["phone"] = data.phone
-            if data.date_of_birth is not None:
-                user_updates["date_of_birth"] = str(data.date_of_birth)
-            if data.avatar_url is not None:
-                user_updates["avatar_url"] = data.avatar_url
-            # grade_level is locked after profile completion
-            if data.target_exam is not None:
-                user_updates["target_exam"] = data.target_exam
-            if data.learning_pace is not None:
-                user_updates["learning_pace"] = data.learning_pace
-            if data.preferred_language is not None:
-                user_updates["preferred_language"] = data.preferred_language
-            if data.timezone is not None:
-                user_updates["timezone"] = data.timezone
+            # Only fields the client actually sent (and didn't null out)
+            user_updates = data.model_dump(
+                include=USER_UPDATE_FIELDS, exclude_unset=True, exclude_none=True
+            )
             
             # Update users table
             if user_updates:
-                user_updates["updated_at"] = datetime.utcnow().isoformat()
-                supabase.table("users").update(user_updates).eq("id", user_id).execute()
+                result = supabase.table("users").update(user_updates).eq("id", user_id).execute()
+                return await UserService._profile_after_user_update(user_id, result.data)
             
             # Get updated profile
             return await UserService.get_user_profile(user_id)
@@ -228,28 +379,13 @@ class UserService:
             NotFoundError: If user not found
         """
         try:
-            # Prepare update data (only non-None fields)
-            updates = {}
-            
-            if data.school_name is not None:
-                updates["school_name"] = data.school_name
-            if data.board is not None:
-                updates["board"] = data.board
-            if data.subjects is not None:
-                updates["subjects"] = data.subjects
-            if data.study_hours_per_day is not None:
-                updates["study_hours_per_day"] = data.study_hours_per_day
-            if data.preferred_study_time is not None:
-                updates["preferred_study_time"] = data.preferred_study_time
-            if data.target_score is not None:
-                updates["target_score"] = data.target_score
-            if data.exam_date is not None:
-                updates["exam_date"] = str(data.exam_date)
+            # Prepare update data (only fields the client sent)
+            updates = data.model_dump(exclude_unset=True, exclude_none=True)
             
             # Update user_profiles table
             if updates:
-                updates["updated_at"] = datetime.utcnow().isoformat()
                 supabase.table("user_profiles").update(updates).eq("user_id", user_id).execute()
+                await UserCache.delete_profile(user_id)
             
             # Get updated profile
             return await UserService.get_user_profile(user_id)
@@ -274,16 +410,11 @@ class UserService:
             Updated user profile
         """
         try:
-            updates = {}
-            
-            if data.preferred_language is not None:
-                updates["preferred_language"] = data.preferred_language
-            if data.timezone is not None:
-                updates["timezone"] = data.timezone
+            updates = data.model_dump(exclude_unset=True, exclude_none=True)
             
             if updates:
-                updates["updated_at"] = datetime.utcnow().isoformat()
-                supabase.table("users").update(updates).eq("id", user_id).execute()
+                result = supabase.table("users").update(updates).eq("id", user_id).execute()
+                return await UserService._profile_after_user_update(user_id, result.data)
             
             return await UserService.get_user_profile(user_id)
             
@@ -305,40 +436,32 @@ class UserService:
         Returns:
             User statistics
         """
+        cached = await UserCache.get_stats(user_id)
+        if cached is not None:
+            return UserStatsResponse.model_validate(cached)
+        
         try:
             # Use the user_stats view we created
-            stats_result = supabase.table("user_stats").select("*").eq("user_id", user_id).execute()
-            
-            if not stats_result.data:
-                # Return default stats if no data yet
-                return UserStatsResponse(
-                    total_study_time_minutes=0,
-                    total_questions_attempted=0,
-                    total_questions_correct=0,
-                    accuracy_percentage=0.0,
-                    current_streak_days=0,
-                    longest_streak_days=0,
-                    total_sessions=0,
-                    achievements_earned=0
-                )
-            
-            stats = stats_result.data[0]
-            
-            return UserStatsResponse(**stats)
-            
+            pool = await get_pool()
+            async with pool.acquire() as conn:
+                stats = await conn.fetchrow(STATS_SQL, user_id)
         except Exception as e:
             logger.error(f"Get user stats error: {str(e)}", exc_info=True)
             # Return default stats on error
-            return UserStatsResponse(
-                total_study_time_minutes=0,
-                total_questions_attempted=0,
-                total_questions_correct=0,
-                accuracy_percentage=0.0,
-                current_streak_days=0,
-                longest_streak_days=0,
-                total_sessions=0,
-                achievements_earned=0
+            return _EMPTY_STATS
+        
+        if stats is None:
+            # Return default stats if no data yet (cached briefly so
+            # newly active users see real numbers soon)
+            await UserCache.set_stats(
+                user_id, _EMPTY_STATS.model_dump(), ttl=UserCache.EMPTY_STATS_TTL
             )
+            return _EMPTY_STATS
+        
+        user_stats = UserStatsResponse(**dict(stats))
+        await UserCache.set_stats(user_id, user_stats.model_dump())
+        
+        return user_stats
 
 
 # ============================================================================
@@ -352,37 +475,67 @@ class AdminUserService:
     async def get_all_users(
         role: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> tuple[List[UserListItem], int]:
+        offset: int = 0,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[str] = None,
+        exact_count: bool = False
+    ) -> tuple[List[UserListItem], Optional[int], Optional[tuple[datetime, str]]]:
         """
         Get paginated list of users (admin only).
         
+        Pass the previous page's next_cursor as after_created_at/after_id to
+        page with a keyset seek, which costs the same at any depth. offset is
+        kept for page-number clients and should be 0 when a cursor is given.
+        
         Args:
             role: Filter by role (optional)
             limit: Number of users per page
             offset: Offset for pagination
+            after_created_at: created_at of the last user on the previous page
+            after_id: id of the last user on the previous page
+            exact_count: Run COUNT(*) (cached for a minute) instead of using
+                the planner estimate for the unfiltered total
         
         Returns:
-            Tuple of (users list, total count)
+            Tuple of (users list, total count, next cursor). Total is only
+            counted when no cursor is given; next cursor is None on the last page.
         """
         try:
-            # Build query
-            query = supabase.table("users").select("*", count="exact")
+            total = None
+            counted = False
+            if after_created_at is None:
+                total = await AdminCache.get_user_count(role)
+            
+            pool = await get_pool()
+            async with pool.acquire() as conn:
+                if after_created_at is None and total is None:
+                    # reltuples only covers the whole table, so role
+                    # filters always need a real count
+                    if not exact_count and role is None:
+                        estimate = await conn.fetchval(USERS_ESTIMATE_SQL)
+                        if estimate is not None and estimate >= 0:
+                            total = estimate
+                    if total is None:
+                        total = await conn.fetchval(USERS_COUNT_SQL, role)
+                        counted = True
+                rows = await conn.fetch(
+                    USERS_LIST_SQL, role, after_created_at, after_id, limit, offset
+                )
             
-            if role:
-                query = query.eq("role", role)
+            if counted:
+                await AdminCache.set_user_count(role, total)
             
-            # Execute with pagination
-            result = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+            users = [UserListItem(**dict(row)) for row in rows]
             
-            users = [UserListItem(**user) for user in result.data]
-            total = result.count or 0
+            next_cursor = None
+            if len(users) == limit:
+                next_cursor = (users[-1].created_at, users[-1].id)
             
-            return users, total
+            return users, total, next_cursor
             
         except Exception as e:
             logger.error(f"Get all users error: {str(e)}", exc_info=True)
-            return [], 0
+            return [], 0, None
     
     @staticmethod
     async def create_admin_user(email: str, full_name: str, password: str) -> UserResponse:
@@ -404,7 +557,8 @@ class AdminUserService:
             # Create user with Supabase Auth
             auth_response = supabase.auth.admin.create_user({
                 "email": email,
-                "password": password[:72],  # Truncate to 72 bytes
+                # bcrypt reads at most 72 bytes; cut on bytes, not characters
+                "password": password.encode("utf-8")[:72].decode("utf-8", errors="ignore"),
                 "email_confirm": True,  # Auto-confirm admin users
                 "user_metadata": {
                     "full_name": full_name,
@@ -418,6 +572,7 @@ class AdminUserService:
             user_id = auth_response.user.id
             
             # Insert into users table
+            now_iso = datetime.now(timezone.utc).isoformat()
             user_data = {
                 "id": user_id,
                 "email": email,
@@ -425,9 +580,9 @@ class AdminUserService:
                 "role": "admin",
                 "is_active": True,
                 "is_verified": True,
-                "email_verified_at": datetime.utcnow().isoformat(),
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
+                "email_verified_at": now_iso,
+                "created_at": now_iso,
+                "updated_at": now_iso,
             }
             
             result = supabase.table("users").insert(user_data).execute()
@@ -435,6 +590,9 @@ class AdminUserService:
             if not result.data:
                 raise ValidationError(message="Failed to create admin profile")
             
+            await AdminCache.clear_user_counts()
+            _ROLE_CACHE.pop(user_id, None)
+            
             logger.info(f"Admin user created: {email}")
             
             return UserResponse(**result.data[0])
@@ -446,6 +604,32 @@ class AdminUserService:
                 details={"error": str(e)}
             )
     
+    @staticmethod
+    async def deactivate_users(user_ids: List[str]) -> bool:
+        """
+        Deactivate several user accounts in one UPDATE (admin only).
+        
+        Args:
+            user_ids: User IDs to deactivate
+        
+        Returns:
+            True if successful
+        """
+        if not user_ids:
+            return True
+        
+        try:
+            supabase.table("users").update(DEACTIVATE_PAYLOAD).in_("id", user_ids).execute()
+            await asyncio.gather(*(UserCache.delete_profile(user_id) for user_id in user_ids))
+            await AdminCache.clear_user_counts()
+            
+            logger.info(f"Users deactivated: {len(user_ids)}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Deactivate users error: {str(e)}")
+            return False
+    
     @staticmethod
     async def deactivate_user(user_id: str) -> bool:
         """
@@ -457,17 +641,32 @@ class AdminUserService:
         Returns:
             True if successful
         """
+        return await AdminUserService.deactivate_users([user_id])
+    
+    @staticmethod
+    async def activate_users(user_ids: List[str]) -> bool:
+        """
+        Activate several user accounts in one UPDATE (admin only).
+        
+        Args:
+            user_ids: User IDs to activate
+        
+        Returns:
+            True if successful
+        """
+        if not user_ids:
+            return True
+        
         try:
-            supabase.table("users").update({
-                "is_active": False,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", user_id).execute()
+            supabase.table("users").update(ACTIVATE_PAYLOAD).in_("id", user_ids).execute()
+            await asyncio.gather(*(UserCache.delete_profile(user_id) for user_id in user_ids))
+            await AdminCache.clear_user_counts()
             
-            logger.info(f"User deactivated: {user_id}")
+            logger.info(f"Users activated: {len(user_ids)}")
             return True
             
         except Exception as e:
-            logger.error(f"Deactivate user error: {str(e)}")
+            logger.error(f"Activate users error: {str(e)}")
             return False
     
     @staticmethod
@@ -481,15 +680,4 @@ class AdminUserService:
         Returns:
             True if successful
         """
-        try:
-            supabase.table("users").update({
-                "is_active": True,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", user_id).execute()
-            
-            logger.info(f"User activated: {user_id}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Activate user error: {str(e)}")
-            return False
\ No newline at end of file
+        return await AdminUserService.activate_users([user_id])
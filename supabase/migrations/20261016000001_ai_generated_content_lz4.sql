@@ -0,0 +1,10 @@
+-- Compress generated content blobs (flashcards, MCQ sets, cheatsheets) at rest.
+--
+-- jsonb values over ~2KB are already TOASTed; LZ4 compresses and, more
+-- importantly, decompresses several times faster than the default pglz.
+-- Readers keep getting plain JSON through PostgREST, so no application
+-- changes are needed. Existing rows keep their old compression until they
+-- are rewritten.
+
+ALTER TABLE public.ai_generated_content
+    ALTER COLUMN content SET COMPRESSION lz4;
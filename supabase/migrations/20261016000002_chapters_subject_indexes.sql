@@ -0,0 +1,11 @@
+-- Support filtering chapters by class/subject at the source.
+--
+-- ChapterService.get_chapters_by_subject joins chapters to their uploaded
+-- material and filters on detected_class/detected_subject, ordered by
+-- chapter_number.
+
+CREATE INDEX IF NOT EXISTS idx_uploaded_materials_class_subject
+    ON public.uploaded_materials (detected_class, detected_subject);
+
+CREATE INDEX IF NOT EXISTS idx_chapters_material_chapter_number
+    ON public.chapters (material_id, chapter_number);
@@ -0,0 +1,19 @@
+-- Let Postgres maintain updated_at on users and user_profiles.
+--
+-- UserService no longer sends "updated_at" in its UPDATE payloads; the
+-- moddatetime trigger stamps the row server-side on every update instead.
+
+CREATE EXTENSION IF NOT EXISTS moddatetime WITH SCHEMA extensions;
+
+ALTER TABLE public.users ALTER COLUMN updated_at SET DEFAULT now();
+ALTER TABLE public.user_profiles ALTER COLUMN updated_at SET DEFAULT now();
+
+DROP TRIGGER IF EXISTS users_touch ON public.users;
+CREATE TRIGGER users_touch
+    BEFORE UPDATE ON public.users
+    FOR EACH ROW EXECUTE FUNCTION extensions.moddatetime(updated_at);
+
+DROP TRIGGER IF EXISTS user_profiles_touch ON public.user_profiles;
+CREATE TRIGGER user_profiles_touch
+    BEFORE UPDATE ON public.user_profiles
+    FOR EACH ROW EXECUTE FUNCTION extensions.moddatetime(updated_at);
@@ -0,0 +1,61 @@
+-- Complete a user's profile in one round trip.
+--
+-- UserService.complete_profile used to read users, update users and
+-- user_profiles, then re-read both tables. This function does the
+-- locked-field check and both updates in one transaction (the users row is
+-- locked, so concurrent completions can't interleave) and returns the
+-- updated rows for the response.
+--
+-- Errors:
+--   P0002 user_not_found
+--   P0001 profile_already_completed
+
+CREATE OR REPLACE FUNCTION public.complete_profile(uid uuid, payload jsonb)
+RETURNS json
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    already_completed boolean;
+BEGIN
+    SELECT profile_completed INTO already_completed
+    FROM public.users
+    WHERE id = uid
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'user_not_found' USING ERRCODE = 'P0002';
+    END IF;
+
+    IF already_completed THEN
+        RAISE EXCEPTION 'profile_already_completed' USING ERRCODE = 'P0001';
+    END IF;
+
+    UPDATE public.users SET
+        grade_level = (payload->>'grade_level')::int,
+        board = payload->>'board',
+        preferred_language = payload->>'preferred_language',
+        target_exam = payload->>'target_exam',
+        profile_completed = true
+    WHERE id = uid;
+
+    UPDATE public.user_profiles SET
+        school_name = payload->>'school_name',
+        board = payload->>'board',
+        subjects = ARRAY(SELECT jsonb_array_elements_text(payload->'subjects')),
+        study_hours_per_day = (payload->>'study_hours_per_day')::int
+    WHERE user_id = uid;
+
+    RETURN (
+        SELECT json_build_object(
+            'user', row_to_json(u),
+            'profile', row_to_json(p)
+        )
+        FROM public.users u
+        LEFT JOIN public.user_profiles p ON p.user_id = u.id
+        WHERE u.id = uid
+    );
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.complete_profile(uuid, jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.complete_profile(uuid, jsonb) TO service_role;
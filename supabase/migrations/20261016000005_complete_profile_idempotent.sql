@@ -0,0 +1,86 @@
+-- Make complete_profile a no-op for identical retries.
+--
+-- Mobile clients retry complete_profile on flaky networks. A retry whose
+-- payload matches what is already stored now returns the current rows
+-- without writing, instead of failing with profile_already_completed, and
+-- the user_profiles UPDATE is skipped when nothing would change.
+
+CREATE OR REPLACE FUNCTION public.complete_profile(uid uuid, payload jsonb)
+RETURNS json
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    u public.users%ROWTYPE;
+    new_subjects text[] := ARRAY(SELECT jsonb_array_elements_text(payload->'subjects'));
+    unchanged boolean;
+BEGIN
+    SELECT * INTO u
+    FROM public.users
+    WHERE id = uid
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'user_not_found' USING ERRCODE = 'P0002';
+    END IF;
+
+    unchanged := (u.grade_level, u.board, u.preferred_language, u.target_exam)
+        IS NOT DISTINCT FROM (
+            (payload->>'grade_level')::int,
+            payload->>'board',
+            payload->>'preferred_language',
+            payload->>'target_exam'
+        )
+        AND NOT EXISTS (
+            SELECT 1 FROM public.user_profiles p
+            WHERE p.user_id = uid
+              AND (p.school_name, p.board, p.subjects, p.study_hours_per_day)
+                  IS DISTINCT FROM (
+                      payload->>'school_name',
+                      payload->>'board',
+                      new_subjects,
+                      (payload->>'study_hours_per_day')::int
+                  )
+        );
+
+    IF u.profile_completed AND NOT unchanged THEN
+        RAISE EXCEPTION 'profile_already_completed' USING ERRCODE = 'P0001';
+    END IF;
+
+    IF NOT u.profile_completed THEN
+        UPDATE public.users SET
+            grade_level = (payload->>'grade_level')::int,
+            board = payload->>'board',
+            preferred_language = payload->>'preferred_language',
+            target_exam = payload->>'target_exam',
+            profile_completed = true
+        WHERE id = uid;
+
+        UPDATE public.user_profiles SET
+            school_name = payload->>'school_name',
+            board = payload->>'board',
+            subjects = new_subjects,
+            study_hours_per_day = (payload->>'study_hours_per_day')::int
+        WHERE user_id = uid
+          AND (school_name, board, subjects, study_hours_per_day)
+              IS DISTINCT FROM (
+                  payload->>'school_name',
+                  payload->>'board',
+                  new_subjects,
+                  (payload->>'study_hours_per_day')::int
+              );
+    END IF;
+
+    RETURN (
+        SELECT json_build_object(
+            'user', row_to_json(u2),
+            'profile', row_to_json(p)
+        )
+        FROM public.users u2
+        LEFT JOIN public.user_profiles p ON p.user_id = u2.id
+        WHERE u2.id = uid
+    );
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.complete_profile(uuid, jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.complete_profile(uuid, jsonb) TO service_role;
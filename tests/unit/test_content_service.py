@@ -0,0 +1,104 @@
+"""
+Unit tests for app.services.content_service.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services import content_service
+from app.services.content_service import ChapterService, _public_url
+
+
+class FakeQuery:
+    """Records PostgREST builder calls and returns canned rows."""
+
+    def __init__(self, data):
+        self.data = data
+        self.tables = []
+        self.calls = []
+
+    def table(self, name):
+        self.tables.append(name)
+        return self
+
+    def execute(self):
+        self.calls.append(("execute", (), {}))
+        return SimpleNamespace(data=self.data)
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return method
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    query = FakeQuery([{"id": "ch-1", "chapter_number": 1}])
+    monkeypatch.setattr(content_service, "supabase", query)
+    content_service._chapters_cache.clear()
+    yield query
+    content_service._chapters_cache.clear()
+
+
+# ============================================================================
+# CHAPTERS BY SUBJECT
+# ============================================================================
+
+def test_get_chapters_filters_on_detected_labels(fake_supabase):
+    chapters = asyncio.run(ChapterService.get_chapters_by_subject("11", "Economics"))
+
+    assert chapters == [{"id": "ch-1", "chapter_number": 1}]
+    assert fake_supabase.tables == ["chapters"]
+    assert ("select", ("*, uploaded_materials!inner()",), {}) in fake_supabase.calls
+    assert ("eq", ("uploaded_materials.detected_class", "11"), {}) in fake_supabase.calls
+    assert ("eq", ("uploaded_materials.detected_subject", "Economics"), {}) in fake_supabase.calls
+    assert ("order", ("chapter_number",), {}) in fake_supabase.calls
+
+
+def test_get_chapters_serves_repeat_calls_from_cache(fake_supabase):
+    asyncio.run(ChapterService.get_chapters_by_subject("11", "Economics"))
+    asyncio.run(ChapterService.get_chapters_by_subject("11", "Economics"))
+
+    assert fake_supabase.tables == ["chapters"]
+
+
+# ============================================================================
+# PUBLIC URL
+# ============================================================================
+
+@pytest.fixture
+def supabase_url(monkeypatch):
+    monkeypatch.setattr(settings, "SUPABASE_URL", "https://example.supabase.co/")
+    return "https://example.supabase.co/storage/v1/object/public"
+
+
+def test_public_url_plain_path(supabase_url):
+    assert (
+        _public_url("study-materials", "uploads/abc_book.pdf")
+        == f"{supabase_url}/study-materials/uploads/abc_book.pdf"
+    )
+
+
+def test_public_url_quotes_spaces(supabase_url):
+    assert (
+        _public_url("study-materials", "uploads/abc_Class 11 Economics.pdf")
+        == f"{supabase_url}/study-materials/uploads/abc_Class%2011%20Economics.pdf"
+    )
+
+
+def test_public_url_quotes_unicode(supabase_url):
+    assert (
+        _public_url("study-materials", "uploads/abc_अर्थशास्त्र.pdf")
+        == f"{supabase_url}/study-materials/uploads/abc_"
+        "%E0%A4%85%E0%A4%B0%E0%A5%8D%E0%A4%A5%E0%A4%B6%E0%A4%BE%E0%A4%B8%E0%A5%8D%E0%A4%A4%E0%A5%8D%E0%A4%B0.pdf"
+    )
+
+
+def test_public_url_keeps_path_separators(supabase_url):
+    url = _public_url("study-materials", "uploads/nested dir/file.pdf")
+
+    assert url == f"{supabase_url}/study-materials/uploads/nested%20dir/file.pdf"